@@ -1,11 +1,12 @@
 """SysML parser: regex-based extraction of model elements from .sysml files."""
 
-from .driver import parse_model_directory
+from .driver import clear_parse_cache, parse_model_directory
 from .model import ModelAttribute, ModelElement, ModelIndex
 
 __all__ = [
     "ModelAttribute",
     "ModelElement",
     "ModelIndex",
+    "clear_parse_cache",
     "parse_model_directory",
 ]
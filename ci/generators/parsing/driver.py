@@ -1,75 +1,195 @@
 """Top-level entry point: parse_model_directory."""
 from __future__ import annotations
 
+import os
+from collections import defaultdict
+from copy import copy
+from dataclasses import dataclass
 from pathlib import Path
+from sys import intern
 
 from ..errors import ParsingError
-from .elements import _extract_elements, _resolve_qualified_names
+from .elements import _extract_elements, _newline_offsets, _resolve_qualified_names
 from .model import ModelElement, ModelIndex
 from .nested import (
-    _extract_action_usages,
     _extract_inline_states,
     _extract_nested_parts,
     _extract_package_part_usages,
-    _extract_signal_defs,
-    _extract_state_defs,
+    _extract_standalone_decls,
 )
-from .regex import ID_DECL_RE
 
 
-def parse_model_directory(model_dir: Path) -> ModelIndex:
-    files = sorted(model_dir.rglob("*.sysml"))
+@dataclass(slots=True)
+class _ParsedFile:
+    """Everything parse_model_directory needs from one file, before qualified names exist.
+
+    Nested part usages and inline states are paired with their parent element and are
+    named once the parents' qualified names are resolved.
+    """
+
+    elements: list[ModelElement]
+    nested_parts: list[tuple[ModelElement, list[ModelElement]]]
+    inline_states: list[tuple[ModelElement, list[ModelElement]]]
+    symbols: list[str]
+
+
+# Parse results per file for parse_model_directory(..., use_cache=True), reused while the
+# file's (st_mtime_ns, st_size) is unchanged. Entries are never handed out directly: each
+# index gets its own element copies (see _copy_parsed_file).
+_FILE_CACHE: dict[Path, tuple[tuple[int, int], _ParsedFile]] = {}
+
+
+def clear_parse_cache() -> None:
+    """Forget all cached per-file parse results."""
+    _FILE_CACHE.clear()
+
+
+def _copy_parsed_file(parsed: _ParsedFile) -> _ParsedFile:
+    """Copy a parse result so that assigning qualified names cannot reach the cached elements.
+
+    Shallow copies suffice: only qualified_name is assigned once an element is parsed.
+    """
+    elements = [copy(element) for element in parsed.elements]
+    by_id = {id(original): element for original, element in zip(parsed.elements, elements)}
+    return _ParsedFile(
+        elements,
+        [(by_id[id(parent)], [copy(child) for child in children]) for parent, children in parsed.nested_parts],
+        [(by_id[id(parent)], [copy(child) for child in children]) for parent, children in parsed.inline_states],
+        parsed.symbols,
+    )
+
+
+def _parse_file(file_path: Path) -> _ParsedFile:
+    """Parse one .sysml file into its elements, nested declarations and declared ID symbols."""
+    text = file_path.read_text(encoding="utf-8")
+    newlines = _newline_offsets(text)
+    file_elements, symbols = _extract_elements(file_path, text, newlines)
+    nested_parts: list[tuple[ModelElement, list[ModelElement]]] = []
+    inline_states: list[tuple[ModelElement, list[ModelElement]]] = []
+    for element in file_elements:
+        if element.kind == "package":
+            children = _extract_package_part_usages(element, text)
+        elif element.kind == "state":
+            children = []
+            states = _extract_inline_states(element, text)
+            if states:
+                inline_states.append((element, states))
+        else:
+            children = _extract_nested_parts(element, text)
+        if children:
+            nested_parts.append((element, children))
+    block_names = {e.name for e in file_elements}
+    signals, actions, state_defs = _extract_standalone_decls(file_path, text, newlines)
+    for sig in signals:
+        if sig.name not in block_names:
+            file_elements.append(sig)
+    for act in actions:
+        if act.name not in block_names:
+            file_elements.append(act)
+    for sd in state_defs:
+        if sd.name not in block_names:
+            file_elements.append(sd)
+    return _ParsedFile(file_elements, nested_parts, inline_states, symbols)
+
+
+def _find_sysml_files(model_dir: Path) -> list[Path]:
+    """Return the .sysml files under *model_dir* in the order of sorted(model_dir.rglob("*.sysml")).
+
+    Walks with os.scandir so the DirEntry type cache replaces per-entry pathlib stats;
+    like rglob, symlinked directories are not descended into and unreadable ones are skipped.
+    """
+    found: list[Path] = []
+    pending = [os.fspath(model_dir)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".sysml") and entry.is_file():
+                    found.append(Path(entry.path))
+    # Sort as paths, not strings, so ordering matches rglob's (component-wise comparison).
+    found.sort()
+    return found
+
+
+def parse_model_directory(model_dir: Path, *, use_cache: bool = False) -> ModelIndex:
+    """Parse every .sysml file under *model_dir* into a ModelIndex.
+
+    With *use_cache*, files whose mtime and size are unchanged since an earlier cached
+    call in this process are not re-read. It is off by default: a generation run parses
+    the model once, and an edit that keeps a file's size within the filesystem's mtime
+    granularity would go unnoticed. Each call returns independent elements.
+    """
+    files = _find_sysml_files(model_dir)
     if not files:
         raise ParsingError(f"No .sysml files found in {model_dir}")
 
+    if not use_cache:
+        parsed = {file_path: _parse_file(file_path) for file_path in files}
+    else:
+        # Drop entries for files that have since been removed from this tree.
+        current = set(files)
+        for cached_path in [p for p in _FILE_CACHE if p not in current and p.is_relative_to(model_dir)]:
+            del _FILE_CACHE[cached_path]
+        parsed = {}
+        for file_path in files:
+            stat = file_path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _FILE_CACHE.get(file_path)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, _parse_file(file_path))
+                _FILE_CACHE[file_path] = cached
+            parsed[file_path] = _copy_parsed_file(cached[1])
+
     all_elements: list[ModelElement] = []
-    declared_ids: dict[str, list[Path]] = {}
+    nested_parts: list[tuple[ModelElement, list[ModelElement]]] = []
+    inline_states: list[tuple[ModelElement, list[ModelElement]]] = []
+    declared_ids: defaultdict[str, list[Path]] = defaultdict(list)
     for file_path in files:
-        text = file_path.read_text(encoding="utf-8")
-        block_elements = _extract_elements(file_path, text)
-        all_elements.extend(block_elements)
-        block_names = {e.name for e in block_elements}
-        for sig in _extract_signal_defs(file_path, text):
-            if sig.name not in block_names:
-                all_elements.append(sig)
-        for act in _extract_action_usages(file_path, text):
-            if act.name not in block_names:
-                all_elements.append(act)
-        for sd in _extract_state_defs(file_path, text):
-            if sd.name not in block_names:
-                all_elements.append(sd)
-        for match in ID_DECL_RE.finditer(text):
-            symbol = match.group("name")
-            declared_ids.setdefault(symbol, []).append(file_path)
+        result = parsed[file_path]
+        all_elements.extend(result.elements)
+        nested_parts.extend(result.nested_parts)
+        inline_states.extend(result.inline_states)
+        for symbol in result.symbols:
+            declared_ids[symbol].append(file_path)
 
     _resolve_qualified_names(all_elements)
     nested: list[ModelElement] = []
-    for element in all_elements:
-        nested.extend(_extract_nested_parts(element))
-    for element in all_elements:
-        if element.kind == "package":
-            for part_usage in _extract_package_part_usages(element):
-                part_usage.qualified_name = element.qualified_name + "::" + part_usage.name
-                nested.append(part_usage)
-    for element in all_elements:
-        children = _extract_inline_states(element)
-        existing_qnames = {e.qualified_name for e in all_elements} | {e.qualified_name for e in nested}
+    for parent, children in nested_parts:
+        prefix = parent.qualified_name + "::"
+        for child in children:
+            child.qualified_name = prefix + child.name
+            nested.append(child)
+    existing_qnames = {e.qualified_name for e in all_elements}
+    existing_qnames.update(e.qualified_name for e in nested)
+    for parent, children in inline_states:
+        prefix = parent.qualified_name + "::"
+        for child in children:
+            child.qualified_name = prefix + child.name
         for child in children:
             if child.qualified_name not in existing_qnames:
                 nested.append(child)
                 existing_qnames.add(child.qualified_name)
     all_elements.extend(nested)
-    all_elements.sort(key=lambda e: (str(e.file_path), e.start_index))
+    # One interned path string per file serves as the sort key for all of its elements.
+    file_keys = {file_path: intern(str(file_path)) for file_path in files}
+    all_elements.sort(key=lambda e: (file_keys[e.file_path], e.start_index))
 
-    by_qname: dict[str, ModelElement] = {}
-    by_name: dict[str, list[ModelElement]] = {}
-    by_short_name: dict[str, list[ModelElement]] = {}
+    # Qualified-name collisions resolve to the last element in file/position order.
+    by_qname = {element.qualified_name: element for element in all_elements}
+    by_name: defaultdict[str, list[ModelElement]] = defaultdict(list)
+    by_short_name: defaultdict[str, list[ModelElement]] = defaultdict(list)
     for element in all_elements:
-        by_qname[element.qualified_name] = element
-        by_name.setdefault(element.name, []).append(element)
-        if element.short_name:
-            by_short_name.setdefault(element.short_name, []).append(element)
-            by_name.setdefault(element.short_name, []).append(element)
+        by_name[element.name].append(element)
+        short_name = element.short_name
+        if short_name:
+            # Short names resolve through by_name as well as by_short_name.
+            by_short_name[short_name].append(element)
+            by_name[short_name].append(element)
 
     alias_map: dict[str, str] = {}
     for element in all_elements:
@@ -82,8 +202,8 @@ def parse_model_directory(model_dir: Path) -> ModelIndex:
         files=files,
         elements=all_elements,
         by_qualified_name=by_qname,
-        by_name=by_name,
-        by_short_name=by_short_name,
-        declared_ids=declared_ids,
+        by_name=dict(by_name),
+        by_short_name=dict(by_short_name),
+        declared_ids=dict(declared_ids),
         alias_map=alias_map,
     )
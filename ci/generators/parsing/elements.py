@@ -1,7 +1,11 @@
 """Core element extraction and qualified-name resolution from SysML text."""
 from __future__ import annotations
 
+import re
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
+from sys import intern
 
 from ..errors import ParsingError
 from .model import ModelAttribute, ModelElement, _strip_quotes, _strip_short_name
@@ -13,7 +17,7 @@ from .regex import (
     ATTR_WEIGHT_ASSIGN_RE,
     ATTRIBUTE_NO_SEMICOLON_RE,
     ATTRIBUTE_RE,
-    BLOCK_DECL_RE,
+    DECL_RE,
     CONSTANT_RE,
     CONSTRAINT_PARAM_RE,
     DOC_RE,
@@ -25,6 +29,9 @@ from .regex import (
     EXPOSE_RE,
     FLOW_PROPERTY_RE,
     FRAME_RE,
+    ID_DECL_KINDS,
+    ID_DECL_RE,
+    ID_NAME_RE,
     INTERFACE_END_RE,
     NAMED_REP_RE,
     PERFORM_ACTION_RE,
@@ -38,159 +45,311 @@ from .regex import (
 )
 
 
-def _line_no(text: str, index: int) -> int:
-    return text.count("\n", 0, index) + 1
+_NEWLINE_RE = re.compile("\n")
+
+
+def _newline_offsets(text: str) -> list[int]:
+    """Return the sorted offsets of every newline in *text*, for repeated line lookups."""
+    return [m.start() for m in _NEWLINE_RE.finditer(text)]
+
+
+def _line_no_from_offsets(newlines: list[int], index: int) -> int:
+    """Return the 1-based line number of *index*, given offsets from _newline_offsets."""
+    return bisect_left(newlines, index) + 1
+
+
+# Characters that can change brace depth or start a region whose braces must be ignored.
+_BRACE_TOKEN_RE = re.compile(r"[{}\"']|/\*")
+_STRING_TAIL_RE = {
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL),
+}
 
 
 def _find_matching_brace(text: str, open_brace_index: int) -> int:
     """Find the matching closing brace, ignoring { } inside block comments and string literals."""
     depth = 0
     i = open_brace_index
-    while i < len(text):
-        ch = text[i]
-        if ch == "{" and depth >= 0:
+    while True:
+        token_match = _BRACE_TOKEN_RE.search(text, i)
+        if token_match is None:
+            break
+        token = token_match.group()
+        i = token_match.end()
+        if token == "{":
             depth += 1
-            i += 1
-            continue
-        if ch == "}" and depth >= 0:
+        elif token == "}":
             depth -= 1
             if depth == 0:
-                return i
-            i += 1
-            continue
-        if ch == "/" and i + 1 < len(text) and text[i + 1] == "*":
-            # Skip block comment /* ... */
-            i += 2
-            while i < len(text) - 1:
-                if text[i] == "*" and text[i + 1] == "/":
-                    i += 2
-                    break
-                i += 1
-            continue
-        if ch == '"':
-            # Skip double-quoted string
-            i += 1
-            while i < len(text):
-                if text[i] == "\\":
-                    i += 2
-                    continue
-                if text[i] == '"':
-                    i += 1
-                    break
-                i += 1
-            continue
-        if ch == "'":
-            # Skip single-quoted string
-            i += 1
-            while i < len(text):
-                if text[i] == "\\":
-                    i += 2
-                    continue
-                if text[i] == "'":
-                    i += 1
-                    break
-                i += 1
-            continue
-        i += 1
+                return token_match.start()
+        elif token == "/*":
+            comment_end = text.find("*/", i)
+            # An unterminated comment runs to the end of the text.
+            i = comment_end + 2 if comment_end >= 0 else max(i, len(text) - 1)
+        else:
+            string_match = _STRING_TAIL_RE[token].match(text, i)
+            if string_match is None:
+                break
+            i = string_match.end()
     raise ParsingError("Unbalanced braces while parsing SysML blocks.")
 
 
-def _extract_elements(file_path: Path, text: str) -> list[ModelElement]:
+def _match_braces(text: str) -> dict[int, int]:
+    """Pair every code-level "{" in *text* with its closing "}" in one pass.
+
+    Uses the same comment and string skipping as _find_matching_brace, so each pair
+    agrees with what that function returns for the opening brace. Braces left
+    unpaired (unbalanced text, or text after an unterminated string) are omitted.
+    """
+    pairs: dict[int, int] = {}
+    open_stack: list[int] = []
+    i = 0
+    while True:
+        token_match = _BRACE_TOKEN_RE.search(text, i)
+        if token_match is None:
+            break
+        token = token_match.group()
+        i = token_match.end()
+        if token == "{":
+            open_stack.append(token_match.start())
+        elif token == "}":
+            if open_stack:
+                pairs[open_stack.pop()] = token_match.start()
+        elif token == "/*":
+            comment_end = text.find("*/", i)
+            i = comment_end + 2 if comment_end >= 0 else max(i, len(text) - 1)
+        else:
+            string_match = _STRING_TAIL_RE[token].match(text, i)
+            if string_match is None:
+                break
+            i = string_match.end()
+    return pairs
+
+
+# Line-anchored body patterns, keyed by rule name: (leading keywords, pattern, first match only).
+# They are located with one keyword scan per body (see _scan_body_lines) instead of one
+# finditer per pattern; each rule still sees exactly the matches its own finditer would.
+_LINE_RULES: dict[str, tuple[tuple[str, ...], re.Pattern[str], bool]] = {
+    "expose": (("expose",), EXPOSE_RE, False),
+    "satisfy": (("satisfy",), SATISFY_RE, False),
+    "allocation_satisfy": (("satisfy",), ALLOCATION_SATISFY_RE, False),
+    "frame": (("frame",), FRAME_RE, False),
+    "render": (("render",), RENDER_RE, True),
+    "attribute": (("attribute",), ATTRIBUTE_RE, False),
+    "attribute_no_semicolon": (("attribute",), ATTRIBUTE_NO_SEMICOLON_RE, False),
+    "alias": (("alias",), ALIAS_RE, False),
+    "flow_property": (("in", "out"), FLOW_PROPERTY_RE, False),
+    "interface_end": (("end",), INTERFACE_END_RE, False),
+    "constraint_param": (("in",), CONSTRAINT_PARAM_RE, False),
+    "state_or_accept": (("state", "accept"), STATE_OR_ACCEPT_RE, False),
+    "entry_then": (("entry",), ENTRY_THEN_RE, True),
+    "entry_action": (("entry",), ENTRY_ACTION_RE, True),
+    "do_action": (("do",), DO_ACTION_RE, True),
+    "state_port": (("in", "out"), STATE_PORT_RE, False),
+    "enum_literal": (("enum",), ENUM_LITERAL_RE, False),
+    "perform_action": (("perform",), PERFORM_ACTION_RE, False),
+    "exhibit": (("exhibit",), EXHIBIT_RE, False),
+    "constant": (("constant",), CONSTANT_RE, False),
+    "action_param": (("in", "out"), ACTION_PARAM_RE, False),
+    "subject": (("subject",), SUBJECT_RE, True),
+}
+
+_COMMON_RULES = ("expose", "satisfy", "allocation_satisfy", "frame", "render", "attribute", "attribute_no_semicolon")
+
+# Extra rules per element kind (block keyword, or effective kind for "... def" variants).
+_KIND_RULES: dict[str, tuple[str, ...]] = {
+    "package": ("alias",),
+    "port": ("flow_property",),
+    "interface": ("interface_end",),
+    "constraint": ("constraint_param",),
+    "state": ("state_or_accept", "entry_then", "entry_action", "do_action", "state_port"),
+    "part": ("perform_action", "exhibit", "constant"),
+    "verification": ("subject",),
+    "enum def": ("enum_literal",),
+    "action def": ("action_param",),
+}
+
+
+@lru_cache(maxsize=None)
+def _line_scanner(
+    kind: str, effective_kind: str
+) -> tuple[re.Pattern[str], dict[str, list[tuple[str, re.Pattern[str], bool]]]]:
+    """Return the keyword locator and keyword -> rules table for an element kind."""
+    names = _COMMON_RULES + _KIND_RULES.get(kind, ())
+    if effective_kind != kind:
+        names += _KIND_RULES.get(effective_kind, ())
+    by_keyword: dict[str, list[tuple[str, re.Pattern[str], bool]]] = {}
+    for name in names:
+        keywords, pattern, first_only = _LINE_RULES[name]
+        for keyword in keywords:
+            by_keyword.setdefault(keyword, []).append((name, pattern, first_only))
+    alternation = "|".join(sorted(by_keyword, key=len, reverse=True))
+    locator = re.compile(rf"(?m)^[^\S\n]*(?:{alternation})\b")
+    return locator, by_keyword
+
+
+def _scan_body_lines(
+    source: str, start: int, end: int, kind: str, effective_kind: str
+) -> dict[str, list[re.Match[str]]]:
+    """Run every line rule that applies to *kind* over source[start:end] in a single keyword scan."""
+    locator, by_keyword = _line_scanner(kind, effective_kind)
+    found: dict[str, list[re.Match[str]]] = {}
+    resume_at: dict[str, int] = {}
+    for line in locator.finditer(source, start, end):
+        line_start = line.start()
+        keyword = line.group().lstrip()
+        for name, pattern, first_only in by_keyword[keyword]:
+            if line_start < resume_at.get(name, start):
+                continue
+            rule_match = pattern.match(source, line_start, end)
+            if rule_match is None:
+                continue
+            found.setdefault(name, []).append(rule_match)
+            resume_at[name] = end if first_only else rule_match.end()
+    return found
+
+
+def _extract_elements(
+    file_path: Path, text: str, newlines: list[int]
+) -> tuple[list[ModelElement], list[str]]:
+    """Extract block elements and the ID-style symbols declared in *text*, in one pass."""
     elements: list[ModelElement] = []
-    for match in BLOCK_DECL_RE.finditer(text):
-        kind = match.group("kind")
-        name = _strip_quotes(match.group("name"))
-        short_name = _strip_short_name(match.group("short"))
+    symbols: list[str] = []
+    # Nested blocks would otherwise rescan their parent's body for every level of nesting.
+    brace_pairs = _match_braces(text)
+    for match in DECL_RE.finditer(text):
+        raw_kind = match.group("kind")
+        if raw_kind is None:
+            symbols.append(match.group("id_name"))
+            continue
+        raw_name = match.group("name")
+        raw_short = match.group("short")
+        if text.find("\n", match.start(), match.end()) >= 0:
+            # A declaration spread over several lines can hide further ID declarations
+            # inside its span, so rescan just that span the way ID_DECL_RE would.
+            symbols.extend(m.group("name") for m in ID_DECL_RE.finditer(text, match.start(), match.end()))
+        elif raw_kind in ID_DECL_KINDS and raw_short is None and ID_NAME_RE.fullmatch(raw_name):
+            symbols.append(raw_name)
+        # Kinds, types and directions come from a small vocabulary; interning dedupes them
+        # across elements and makes the downstream dict/set lookups on them cheap.
+        kind = intern(raw_kind)
+        name = _strip_quotes(raw_name)
+        short_name = _strip_short_name(raw_short)
         tail = match.group("tail") or ""
         open_brace_index = text.find("{", match.start())
         if open_brace_index < 0:
             continue
-        close_brace_index = _find_matching_brace(text, open_brace_index)
-        body = text[open_brace_index + 1 : close_brace_index]
-        start_line = _line_no(text, match.start())
-        end_line = _line_no(text, close_brace_index)
+        close_brace_index = brace_pairs.get(open_brace_index)
+        if close_brace_index is None:
+            # Declarations inside comments or strings are not paired by _match_braces.
+            close_brace_index = _find_matching_brace(text, open_brace_index)
+        body_start = open_brace_index + 1
+        # Body scans run over the file text with pos/endpos instead of a copied slice. "^"
+        # never matches at pos itself, though, so a body whose first line carries content
+        # (e.g. a one-line block) is still scanned as a slice, where its start is a line start.
+        first_newline = text.find("\n", body_start, close_brace_index)
+        first_line_end = first_newline if first_newline >= 0 else close_brace_index
+        if text[body_start:first_line_end].strip():
+            source, lo, hi = text[body_start:close_brace_index], 0, close_brace_index - body_start
+        else:
+            source, lo, hi = text, body_start, close_brace_index
+        start_line = _line_no_from_offsets(newlines, match.start())
+        end_line = _line_no_from_offsets(newlines, close_brace_index)
+
+        effective_kind = kind
+        raw_text = text[match.start():open_brace_index]
+        if kind == "attribute" and "def" in raw_text:
+            effective_kind = "attribute def"
+        if kind == "action" and "def" in raw_text:
+            effective_kind = "action def"
+        if kind == "verification" and "def" in raw_text:
+            effective_kind = "verification def"
+        if kind == "enum" and "def" in raw_text:
+            effective_kind = "enum def"
 
-        doc_match = DOC_RE.search(body)
+        lines = _scan_body_lines(source, lo, hi, kind, effective_kind)
+        no_matches: list[re.Match[str]] = []
+
+        # Unanchored scans below are skipped when a literal every match must contain is absent.
+        doc_match = DOC_RE.search(source, lo, hi) if source.find("/*", lo, hi) >= 0 else None
         doc = ""
         if doc_match:
             raw_doc = doc_match.group("doc")
             doc_lines = [line.strip() for line in raw_doc.splitlines()]
             doc = "\n".join(doc_lines).strip()
 
-        render_match = RENDER_RE.search(body)
-        render_kind = render_match.group("kind") if render_match else None
+        render_matches = lines.get("render")
+        render_kind = intern(render_matches[0].group("kind")) if render_matches else None
 
         attributes: list[ModelAttribute] = []
-        for attr_match in ATTRIBUTE_RE.finditer(body):
+        for attr_match in lines.get("attribute", no_matches):
             attr_name = attr_match.group("name")
             raw_type = (attr_match.group("type") or "").strip()
-            attr_type = raw_type or None
+            attr_type = intern(raw_type) if raw_type else None
             attributes.append(ModelAttribute(name=attr_name, type=attr_type))
         seen_attr_names = {a.name for a in attributes}
-        for attr_match in ATTRIBUTE_NO_SEMICOLON_RE.finditer(body):
+        for attr_match in lines.get("attribute_no_semicolon", no_matches):
             attr_name = attr_match.group("name")
             if attr_name in seen_attr_names:
                 continue
             seen_attr_names.add(attr_name)
             raw_type = (attr_match.group("type") or "").strip()
-            attributes.append(ModelAttribute(name=attr_name, type=raw_type or None))
+            attributes.append(ModelAttribute(name=attr_name, type=intern(raw_type) if raw_type else None))
 
         supertypes: list[str] = []
         tail_clean = tail.strip()
         if tail_clean:
             for part in tail_clean.split(","):
-                part_clean = part.strip()
-                if not part_clean:
-                    continue
-                while part_clean.startswith(":") or part_clean.startswith(">"):
-                    part_clean = part_clean[1:].lstrip()
+                # Drop specialization markers such as ":>" or ":>>" ahead of the type name.
+                part_clean = part.strip().lstrip(":> \t")
                 if not part_clean:
                     continue
-                supertypes.append(_strip_quotes(part_clean))
-
-        aliases: list[tuple[str, str]] = []
-        if kind == "package":
-            for alias_match in ALIAS_RE.finditer(body):
-                aliases.append((alias_match.group("alias"), alias_match.group("target")))
-
-        flow_properties: list[tuple[str, str, str, str]] = []
-        if kind == "port":
-            for fp_match in FLOW_PROPERTY_RE.finditer(body):
-                flow_properties.append(
-                    (
-                        fp_match.group("dir"),
-                        fp_match.group("kind"),
-                        fp_match.group("name").strip("'"),
-                        fp_match.group("type").strip(),
-                    )
-                )
+                supertypes.append(intern(_strip_quotes(part_clean)))
 
-        interface_ends: list[tuple[str, str]] = []
-        if kind == "interface":
-            for end_match in INTERFACE_END_RE.finditer(body):
-                interface_ends.append((end_match.group("role"), end_match.group("port_type")))
+        aliases: list[tuple[str, str]] = [
+            (alias_match.group("alias"), alias_match.group("target"))
+            for alias_match in lines.get("alias", no_matches)
+        ]
 
-        allocation_satisfy: list[tuple[str, str]] = []
-        for sat_match in ALLOCATION_SATISFY_RE.finditer(body):
-            allocation_satisfy.append(
-                (sat_match.group(1).strip(), sat_match.group(2).strip())
+        flow_properties: list[tuple[str, str, str, str]] = [
+            (
+                intern(fp_match.group("dir")),
+                intern(fp_match.group("kind")),
+                fp_match.group("name").strip("'"),
+                intern(fp_match.group("type").strip()),
             )
+            for fp_match in lines.get("flow_property", no_matches)
+        ]
+
+        interface_ends: list[tuple[str, str]] = [
+            (end_match.group("role"), intern(end_match.group("port_type")))
+            for end_match in lines.get("interface_end", no_matches)
+        ]
+
+        allocation_satisfy: list[tuple[str, str]] = [
+            (sat_match.group(1).strip(), sat_match.group(2).strip())
+            for sat_match in lines.get("allocation_satisfy", no_matches)
+        ]
 
         refinement_dependencies: list[tuple[str, str]] = []
-        for ref_match in REFINEMENT_DEPENDENCY_RE.finditer(body):
-            refinement_dependencies.append(
-                (ref_match.group(1).strip(), ref_match.group(2).strip())
-            )
+        if source.find("#refinement", lo, hi) >= 0:
+            refinement_dependencies = [
+                (pim_req.strip(), cim_req.strip())
+                for pim_req, cim_req in REFINEMENT_DEPENDENCY_RE.findall(source, lo, hi)
+            ]
 
-        constraint_params: list[tuple[str, str]] = []
-        if kind == "constraint":
-            for cp_match in CONSTRAINT_PARAM_RE.finditer(body):
-                constraint_params.append(
-                    (cp_match.group("name"), cp_match.group("type").strip())
-                )
+        constraint_params: list[tuple[str, str]] = [
+            (cp_match.group("name"), cp_match.group("type").strip())
+            for cp_match in lines.get("constraint_param", no_matches)
+        ]
 
-        value_assignments = [float(m.group(1)) for m in ATTR_VALUE_ASSIGN_RE.finditer(body)]
-        weight_assignments = [float(m.group(1)) for m in ATTR_WEIGHT_ASSIGN_RE.finditer(body)]
+        value_assignments: list[float] = []
+        weight_assignments: list[float] = []
+        if source.find("::>", lo, hi) >= 0:
+            if source.find("value", lo, hi) >= 0:
+                value_assignments = [float(v) for v in ATTR_VALUE_ASSIGN_RE.findall(source, lo, hi)]
+            if source.find("weight", lo, hi) >= 0:
+                weight_assignments = [float(w) for w in ATTR_WEIGHT_ASSIGN_RE.findall(source, lo, hi)]
 
         transitions: list[tuple[str, str, str, str | None]] = []
         entry_target: str | None = None
@@ -199,7 +358,7 @@ def _extract_elements(file_path: Path, text: str) -> list[ModelElement]:
         state_ports: list[tuple[str, str, str]] = []
         if kind == "state":
             current_state: str | None = None
-            for sa_match in STATE_OR_ACCEPT_RE.finditer(body):
+            for sa_match in lines.get("state_or_accept", no_matches):
                 if sa_match.group("state_name"):
                     current_state = sa_match.group("state_name")
                 elif sa_match.group("signal") and current_state:
@@ -207,76 +366,58 @@ def _extract_elements(file_path: Path, text: str) -> list[ModelElement]:
                     transitions.append(
                         (current_state, sa_match.group("signal"), sa_match.group("target"), action if action else None)
                     )
-            et_match = ENTRY_THEN_RE.search(body)
-            if et_match:
-                entry_target = et_match.group("target")
-            ea_match = ENTRY_ACTION_RE.search(body)
-            if ea_match:
-                entry_action = ea_match.group("action")
-            da_match = DO_ACTION_RE.search(body)
-            if da_match:
-                do_action = da_match.group("action")
-            for sp_match in STATE_PORT_RE.finditer(body):
+            et_matches = lines.get("entry_then")
+            if et_matches:
+                entry_target = et_matches[0].group("target")
+            ea_matches = lines.get("entry_action")
+            if ea_matches:
+                entry_action = ea_matches[0].group("action")
+            da_matches = lines.get("do_action")
+            if da_matches:
+                do_action = da_matches[0].group("action")
+            for sp_match in lines.get("state_port", no_matches):
                 state_ports.append(
                     (sp_match.group("dir"), _strip_quotes(sp_match.group("name")), sp_match.group("type").strip())
                 )
 
-        effective_kind = kind
-        raw_text = text[match.start():open_brace_index]
-        if kind == "attribute" and "def" in raw_text:
-            effective_kind = "attribute def"
-        if kind == "action" and "def" in raw_text:
-            effective_kind = "action def"
-        if kind == "verification" and "def" in raw_text:
-            effective_kind = "verification def"
-        if kind == "enum" and "def" in raw_text:
-            effective_kind = "enum def"
+        enum_literals: list[str] = [m.group("name") for m in lines.get("enum_literal", no_matches)]
 
-        enum_literals: list[str] = []
-        if effective_kind == "enum def":
-            enum_literals = [m.group("name") for m in ENUM_LITERAL_RE.finditer(body)]
-
-        perform_actions: list[tuple[str, str]] = []
-        exhibit_refs: list[str] = []
-        constants: list[tuple[str, str, str]] = []
-        if kind == "part":
-            for pa_match in PERFORM_ACTION_RE.finditer(body):
-                perform_actions.append(
-                    (pa_match.group("name"), pa_match.group("type").strip())
-                )
-            for ex_match in EXHIBIT_RE.finditer(body):
-                exhibit_refs.append(ex_match.group("name"))
-            for const_match in CONSTANT_RE.finditer(body):
-                constants.append(
-                    (
-                        const_match.group("name"),
-                        const_match.group("type").strip(),
-                        const_match.group("value").strip(),
-                    )
-                )
+        perform_actions: list[tuple[str, str]] = [
+            (pa_match.group("name"), pa_match.group("type").strip())
+            for pa_match in lines.get("perform_action", no_matches)
+        ]
+        exhibit_refs: list[str] = [ex_match.group("name") for ex_match in lines.get("exhibit", no_matches)]
+        constants: list[tuple[str, str, str]] = [
+            (
+                const_match.group("name"),
+                const_match.group("type").strip(),
+                const_match.group("value").strip(),
+            )
+            for const_match in lines.get("constant", no_matches)
+        ]
 
-        action_params: list[tuple[str, str, str | None]] = []
-        if effective_kind == "action def":
-            for ap_match in ACTION_PARAM_RE.finditer(body):
-                action_params.append(
-                    (ap_match.group("dir"), ap_match.group("name"), (ap_match.group("type") or "").strip() or None)
-                )
+        action_params: list[tuple[str, str, str | None]] = [
+            (ap_match.group("dir"), ap_match.group("name"), (ap_match.group("type") or "").strip() or None)
+            for ap_match in lines.get("action_param", no_matches)
+        ]
 
         textual_representations: list[tuple[str, str, str]] = []
-        for tr_match in NAMED_REP_RE.finditer(body):
-            rep_name = tr_match.group(1)
-            lang = tr_match.group(2).strip()
-            rep_body = tr_match.group(3)
-            if rep_body is not None:
-                textual_representations.append((rep_name, lang, rep_body))
+        if source.find("language", lo, hi) >= 0:
+            for tr_match in NAMED_REP_RE.finditer(source, lo, hi):
+                rep_name = tr_match.group(1)
+                lang = tr_match.group(2).strip()
+                rep_body = tr_match.group(3)
+                if rep_body is not None:
+                    textual_representations.append((rep_name, lang, rep_body))
 
         verify_refs: list[str] = []
         subject_ref: tuple[str, str] | None = None
         if kind == "verification":
-            verify_refs = [m.group(1).strip() for m in VERIFY_REF_RE.finditer(body)]
-            sub_match = SUBJECT_RE.search(body)
-            if sub_match:
-                subject_ref = (sub_match.group(1).strip(), sub_match.group(2).strip())
+            if source.find("verify", lo, hi) >= 0:
+                verify_refs = [ref.strip() for ref in VERIFY_REF_RE.findall(source, lo, hi)]
+            sub_matches = lines.get("subject")
+            if sub_matches:
+                subject_ref = (sub_matches[0].group(1).strip(), sub_matches[0].group(2).strip())
 
         elements.append(
             ModelElement(
@@ -288,50 +429,72 @@ def _extract_elements(file_path: Path, text: str) -> list[ModelElement]:
                 end_index=close_brace_index,
                 start_line=start_line,
                 end_line=end_line,
-                body=body,
+                body_start=body_start,
+                body_end=close_brace_index,
                 doc=doc,
-                expose_refs=[m.group("ref").strip() for m in EXPOSE_RE.finditer(body)],
-                satisfy_refs=[m.group("ref").strip() for m in SATISFY_RE.finditer(body)],
-                frame_refs=[m.group("ref").strip() for m in FRAME_RE.finditer(body)],
+                expose_refs=tuple(m.group("ref").strip() for m in lines.get("expose", no_matches)),
+                satisfy_refs=tuple(m.group("ref").strip() for m in lines.get("satisfy", no_matches)),
+                frame_refs=tuple(m.group("ref").strip() for m in lines.get("frame", no_matches)),
                 render_kind=render_kind,
-                supertypes=supertypes,
-                attributes=attributes,
-                constants=constants,
-                aliases=aliases,
-                flow_properties=flow_properties,
-                interface_ends=interface_ends,
-                allocation_satisfy=allocation_satisfy,
-                refinement_dependencies=refinement_dependencies,
-                constraint_params=constraint_params,
-                value_assignments=value_assignments,
-                weight_assignments=weight_assignments,
-                transitions=transitions,
+                supertypes=tuple(supertypes),
+                attributes=tuple(attributes),
+                constants=tuple(constants),
+                aliases=tuple(aliases),
+                flow_properties=tuple(flow_properties),
+                interface_ends=tuple(interface_ends),
+                allocation_satisfy=tuple(allocation_satisfy),
+                refinement_dependencies=tuple(refinement_dependencies),
+                constraint_params=tuple(constraint_params),
+                value_assignments=tuple(value_assignments),
+                weight_assignments=tuple(weight_assignments),
+                transitions=tuple(transitions),
                 entry_target=entry_target,
                 entry_action=entry_action,
                 do_action=do_action,
-                state_ports=state_ports,
-                textual_representations=textual_representations,
-                perform_actions=perform_actions,
-                action_params=action_params,
-                verify_refs=verify_refs,
+                state_ports=tuple(state_ports),
+                textual_representations=tuple(textual_representations),
+                perform_actions=tuple(perform_actions),
+                action_params=tuple(action_params),
+                verify_refs=tuple(verify_refs),
                 subject_ref=subject_ref,
-                exhibit_refs=exhibit_refs,
-                enum_literals=enum_literals,
+                exhibit_refs=tuple(exhibit_refs),
+                enum_literals=tuple(enum_literals),
             )
         )
-    return elements
+    return elements, symbols
+
+
+_CONTAINER_KINDS = frozenset({"package", "state", "verification def"})
 
 
 def _resolve_qualified_names(elements: list[ModelElement]) -> None:
-    containers = [e for e in elements if e.kind in ("package", "state", "verification def")]
+    """Assign qualified names from the packages/states that textually enclose each element.
+
+    Elements are swept per file in start order while keeping a stack of the
+    containers still open at the current position (outermost first).
+    """
+    by_file: dict[Path, list[ModelElement]] = {}
     for element in elements:
-        enclosing = [
-            c
-            for c in containers
-            if c is not element
-            and c.file_path == element.file_path
-            and c.start_index < element.start_index < element.end_index < c.end_index
-        ]
-        enclosing.sort(key=lambda c: c.end_index - c.start_index, reverse=True)
-        path = [c.name for c in enclosing]
-        element.qualified_name = "::".join(path + [element.name]) if path else element.name
+        by_file.setdefault(element.file_path, []).append(element)
+
+    for file_elements in by_file.values():
+        file_elements.sort(key=lambda e: e.start_index)
+        open_containers: list[ModelElement] = []
+        for element in file_elements:
+            start = element.start_index
+            while open_containers and open_containers[-1].end_index <= start:
+                open_containers.pop()
+            path = [
+                c.name
+                for c in open_containers
+                if c.start_index < start and element.end_index < c.end_index
+            ]
+            if not path:
+                element.qualified_name = element.name
+            elif len(path) == 1:
+                # Most elements sit directly under their package.
+                element.qualified_name = f"{path[0]}::{element.name}"
+            else:
+                element.qualified_name = "::".join(path + [element.name])
+            if element.kind in _CONTAINER_KINDS:
+                open_containers.append(element)
@@ -1,18 +1,23 @@
-"""Dataclasses for the model index: ModelAttribute, ModelElement, ModelIndex."""
+"""Data types for the model index: ModelAttribute, ModelElement, ModelIndex."""
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 
-@dataclass(slots=True)
-class ModelAttribute:
+class ModelAttribute(NamedTuple):
+    """Attribute usage on an element; a plain tuple since models carry many of them."""
+
     name: str
     type: str | None
 
 
 @dataclass(slots=True)
 class ModelElement:
+    """One parsed declaration. Sequence fields are tuples: the index is read-only after parsing."""
+
     kind: str
     name: str
     short_name: str | None
@@ -21,36 +26,37 @@ class ModelElement:
     end_index: int
     start_line: int
     end_line: int
-    body: str
+    body_start: int = 0  # body is text[body_start:body_end] of the source file; empty for bodiless declarations
+    body_end: int = 0
     qualified_name: str = ""
     doc: str = ""
-    expose_refs: list[str] = field(default_factory=list)
-    satisfy_refs: list[str] = field(default_factory=list)
-    frame_refs: list[str] = field(default_factory=list)
+    expose_refs: tuple[str, ...] = ()
+    satisfy_refs: tuple[str, ...] = ()
+    frame_refs: tuple[str, ...] = ()
     render_kind: str | None = None
-    supertypes: list[str] = field(default_factory=list)
-    attributes: list[ModelAttribute] = field(default_factory=list)
-    constants: list[tuple[str, str, str]] = field(default_factory=list)  # (name, type, value_str) for constant decls
-    aliases: list[tuple[str, str]] = field(default_factory=list)  # (alias_name, target_name)
-    flow_properties: list[tuple[str, str, str, str]] = field(default_factory=list)  # (direction, kind, name, type)
-    interface_ends: list[tuple[str, str]] = field(default_factory=list)  # (role, port_type) for interface def
-    allocation_satisfy: list[tuple[str, str]] = field(default_factory=list)  # (requirement_name, logical_block_path)
-    refinement_dependencies: list[tuple[str, str]] = field(default_factory=list)  # (pim_req, cim_req)
-    constraint_params: list[tuple[str, str]] = field(default_factory=list)  # (name, type) for constraint def
-    value_assignments: list[float] = field(default_factory=list)  # attribute ::> value = N (order preserved)
-    weight_assignments: list[float] = field(default_factory=list)  # attribute ::> weight = N (order preserved)
-    transitions: list[tuple[str, str, str, str | None]] = field(default_factory=list)  # (source_state, signal, target_state, optional transition_action)
+    supertypes: tuple[str, ...] = ()
+    attributes: tuple[ModelAttribute, ...] = ()
+    constants: tuple[tuple[str, str, str], ...] = ()  # (name, type, value_str) for constant decls
+    aliases: tuple[tuple[str, str], ...] = ()  # (alias_name, target_name)
+    flow_properties: tuple[tuple[str, str, str, str], ...] = ()  # (direction, kind, name, type)
+    interface_ends: tuple[tuple[str, str], ...] = ()  # (role, port_type) for interface def
+    allocation_satisfy: tuple[tuple[str, str], ...] = ()  # (requirement_name, logical_block_path)
+    refinement_dependencies: tuple[tuple[str, str], ...] = ()  # (pim_req, cim_req)
+    constraint_params: tuple[tuple[str, str], ...] = ()  # (name, type) for constraint def
+    value_assignments: tuple[float, ...] = ()  # attribute ::> value = N (order preserved)
+    weight_assignments: tuple[float, ...] = ()  # attribute ::> weight = N (order preserved)
+    transitions: tuple[tuple[str, str, str, str | None], ...] = ()  # (source_state, signal, target_state, optional transition_action)
     entry_target: str | None = None  # initial state from "entry; then X;"
     entry_action: str | None = None  # "entry actionName { ... }"
     do_action: str | None = None  # "do actionName { ... }"
-    state_ports: list[tuple[str, str, str]] = field(default_factory=list)  # (dir, name, type) for in/out ports on states
-    textual_representations: list[tuple[str, str, str]] = field(default_factory=list)  # (name, language, body) for named rep blocks
-    perform_actions: list[tuple[str, str]] = field(default_factory=list)  # (name, type) for perform action usages
-    action_params: list[tuple[str, str, str | None]] = field(default_factory=list)  # (dir, name, type) for in/out params on action defs
-    verify_refs: list[str] = field(default_factory=list)  # requirement refs from objective { verify X; } in verification def
+    state_ports: tuple[tuple[str, str, str], ...] = ()  # (dir, name, type) for in/out ports on states
+    textual_representations: tuple[tuple[str, str, str], ...] = ()  # (name, language, body) for named rep blocks
+    perform_actions: tuple[tuple[str, str], ...] = ()  # (name, type) for perform action usages
+    action_params: tuple[tuple[str, str, str | None], ...] = ()  # (dir, name, type) for in/out params on action defs
+    verify_refs: tuple[str, ...] = ()  # requirement refs from objective { verify X; } in verification def
     subject_ref: tuple[str, str] | None = None  # (name, type) from subject name : Type; in verification def
-    exhibit_refs: list[str] = field(default_factory=list)  # state usage names from exhibit <name>;
-    enum_literals: list[str] = field(default_factory=list)  # literal names for enum def
+    exhibit_refs: tuple[str, ...] = ()  # state usage names from exhibit <name>;
+    enum_literals: tuple[str, ...] = ()  # literal names for enum def
 
 
 @dataclass(slots=True)
@@ -70,12 +76,16 @@ class ModelIndex:
         return None
 
 
+# Names and short names repeat across declarations; both helpers are pure, return
+# immutable strings, and keep the uncached function on __wrapped__.
+@lru_cache(maxsize=4096)
 def _strip_quotes(value: str) -> str:
     if value.startswith("'") and value.endswith("'"):
         return value[1:-1]
     return value
 
 
+@lru_cache(maxsize=4096)
 def _strip_short_name(value: str | None) -> str | None:
     if value is None:
         return None
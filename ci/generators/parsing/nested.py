@@ -1,120 +1,105 @@
 """Extraction functions for nested / inline / standalone declarations."""
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from sys import intern
 
-from .elements import _line_no
+from .elements import _line_no_from_offsets
 from .model import ModelElement, _strip_quotes, _strip_short_name
 from .regex import (
-    ACTION_USAGE_RE,
     ATTR_DEF_SIGNAL_RE,
     INLINE_STATE_RE,
     PART_INLINE_RE,
+    STANDALONE_DECL_RE,
     STATE_DEF_RE,
 )
 
+# Interned like the block kinds in _extract_elements; "state", "action" and "part"
+# are identifier-like literals and interned by the compiler already.
+_KIND_SIGNAL = intern("attribute def")
 
-def _extract_signal_defs(file_path: Path, text: str) -> list[ModelElement]:
-    """Extract standalone 'attribute def SignalName;' declarations (no body block)."""
-    signals: list[ModelElement] = []
-    for match in ATTR_DEF_SIGNAL_RE.finditer(text):
-        name = match.group("name")
-        start_line = _line_no(text, match.start())
-        signals.append(
-            ModelElement(
-                kind="attribute def",
-                name=name,
-                short_name=None,
-                file_path=file_path,
-                start_index=match.start(),
-                end_index=match.end(),
-                start_line=start_line,
-                end_line=start_line,
-                body="",
-            )
-        )
-    return signals
 
+def _standalone_decl(kind: str, file_path: Path, match: re.Match[str], group: str, newlines: list[int]) -> ModelElement:
+    """Build a bodiless element named by *group* of a standalone declaration match."""
+    start_line = _line_no_from_offsets(newlines, match.start())
+    return ModelElement(
+        kind=kind,
+        name=match.group(group),
+        short_name=None,
+        file_path=file_path,
+        start_index=match.start(),
+        end_index=match.end(),
+        start_line=start_line,
+        end_line=start_line,
+    )
 
-def _extract_action_usages(file_path: Path, text: str) -> list[ModelElement]:
-    """Extract standalone 'action name : ActionDef;' declarations."""
+
+def _extract_standalone_decls(
+    file_path: Path, text: str, newlines: list[int]
+) -> tuple[list[ModelElement], list[ModelElement], list[ModelElement]]:
+    """Extract standalone 'attribute def Signal;', 'action name : ActionDef;' and 'state def State;' declarations (no body block) in one pass. Returns (signals, action usages, state defs)."""
+    signals: list[ModelElement] = []
     usages: list[ModelElement] = []
-    for match in ACTION_USAGE_RE.finditer(text):
-        name = match.group("name")
-        action_type = match.group("type").strip()
-        start_line = _line_no(text, match.start())
-        usages.append(
-            ModelElement(
-                kind="action",
-                name=name,
-                short_name=None,
-                file_path=file_path,
-                start_index=match.start(),
-                end_index=match.end(),
-                start_line=start_line,
-                end_line=start_line,
-                body="",
-                supertypes=[action_type],
-            )
-        )
-    return usages
+    defs: list[ModelElement] = []
+    for match in STANDALONE_DECL_RE.finditer(text):
+        if match.group("signal") is not None:
+            signals.append(_standalone_decl(_KIND_SIGNAL, file_path, match, "signal", newlines))
+        elif match.group("state") is not None:
+            defs.append(_standalone_decl("state", file_path, match, "state", newlines))
+        else:
+            usage = _standalone_decl("action", file_path, match, "action", newlines)
+            usage.supertypes = (intern(match.group("action_type").strip()),)
+            usages.append(usage)
+            # An action type may run over line breaks up to its ';', so a signal or state
+            # def can end inside it; a separate scan per pattern would report that too.
+            if "\n" in match.group("action_type"):
+                for pattern, kind, found in ((ATTR_DEF_SIGNAL_RE, _KIND_SIGNAL, signals), (STATE_DEF_RE, "state", defs)):
+                    inner = pattern.search(text, match.start() + 1, match.end())
+                    if inner is not None:
+                        found.append(_standalone_decl(kind, file_path, inner, "name", newlines))
+    return signals, usages, defs
 
 
-def _extract_inline_states(parent: ModelElement) -> list[ModelElement]:
-    """Extract inline 'state StateName;' declarations from a state machine body."""
+def _extract_inline_states(parent: ModelElement, text: str) -> list[ModelElement]:
+    """Extract inline 'state StateName;' declarations from a state machine body in the file *text*. Caller must set qualified_name to parent.qualified_name + '::' + name."""
     children: list[ModelElement] = []
-    if not parent.body or parent.kind != "state":
+    if parent.kind != "state" or text.find("state", parent.body_start, parent.body_end) < 0:
         return children
-    for match in INLINE_STATE_RE.finditer(parent.body):
+    file_path, offset, line = parent.file_path, parent.start_index, parent.start_line
+    for match in INLINE_STATE_RE.finditer(text[parent.body_start : parent.body_end]):
         name = match.group("name")
         child = ModelElement(
             kind="state",
             name=name,
             short_name=None,
-            file_path=parent.file_path,
-            start_index=parent.start_index + match.start(),
-            end_index=parent.start_index + match.end(),
-            start_line=parent.start_line,
-            end_line=parent.start_line,
-            body="",
-            qualified_name=parent.qualified_name + "::" + name if parent.qualified_name else name,
+            file_path=file_path,
+            start_index=offset + match.start(),
+            end_index=offset + match.end(),
+            start_line=line,
+            end_line=line,
         )
         children.append(child)
     return children
 
 
-def _extract_state_defs(file_path: Path, text: str) -> list[ModelElement]:
-    """Extract standalone 'state def StateName;' declarations (no body block)."""
-    defs: list[ModelElement] = []
-    for match in STATE_DEF_RE.finditer(text):
-        name = match.group("name")
-        start_line = _line_no(text, match.start())
-        defs.append(
-            ModelElement(
-                kind="state",
-                name=name,
-                short_name=None,
-                file_path=file_path,
-                start_index=match.start(),
-                end_index=match.end(),
-                start_line=start_line,
-                end_line=start_line,
-                body="",
-            )
-        )
-    return defs
+def _split_types(types: str | None) -> list[str]:
+    """Split a 'A, B' type list into stripped, non-empty names; most parts have a single type."""
+    types_str = (types or "").strip()
+    if "," not in types_str:
+        return [intern(types_str)] if types_str else []
+    return [intern(t) for t in (t.strip() for t in types_str.split(",")) if t]
 
 
-def _extract_package_part_usages(package_elem: ModelElement) -> list[ModelElement]:
+def _extract_package_part_usages(package_elem: ModelElement, text: str) -> list[ModelElement]:
     """Extract part usages from a package body (e.g. 'part hl7AdapterService : PhysicalArchitecture::HL7AdapterService;'). Caller must set qualified_name to package.qualified_name + '::' + name."""
     usages: list[ModelElement] = []
-    if not package_elem.body or package_elem.kind != "package":
+    if package_elem.kind != "package" or text.find("part", package_elem.body_start, package_elem.body_end) < 0:
         return usages
-    for match in PART_INLINE_RE.finditer(package_elem.body):
+    for match in PART_INLINE_RE.finditer(text[package_elem.body_start : package_elem.body_end]):
         name = _strip_quotes(match.group("name"))
         short = _strip_short_name(match.group("short"))
-        types_str = (match.group("types") or "").strip()
-        supertypes = [t.strip() for t in types_str.split(",") if t.strip()]
+        supertypes = _split_types(match.group("types"))
         usages.append(
             ModelElement(
                 kind="part",
@@ -125,24 +110,22 @@ def _extract_package_part_usages(package_elem: ModelElement) -> list[ModelElemen
                 end_index=package_elem.end_index,
                 start_line=package_elem.start_line,
                 end_line=package_elem.end_line,
-                body="",
                 doc="",
-                supertypes=supertypes,
+                supertypes=tuple(supertypes),
             )
         )
     return usages
 
 
-def _extract_nested_parts(parent: ModelElement) -> list[ModelElement]:
-    """Extract nested part declarations from a part block body (e.g. 'part nodeScored : ScoredX;'). Only part blocks are scanned so package bodies are not traversed (avoiding wrong qualified_name). Accepts both part usages and part defs so nested parts under part defs (e.g. HL7AdapterService) are included."""
+def _extract_nested_parts(parent: ModelElement, text: str) -> list[ModelElement]:
+    """Extract nested part declarations from a part block body (e.g. 'part nodeScored : ScoredX;'). Only part blocks are scanned so package bodies are not traversed (avoiding wrong qualified_name). Accepts both part usages and part defs so nested parts under part defs (e.g. HL7AdapterService) are included. Caller must set qualified_name to parent.qualified_name + '::' + name."""
     children: list[ModelElement] = []
-    if not parent.body or parent.kind not in ("part", "part def"):
+    if parent.kind not in ("part", "part def") or text.find("part", parent.body_start, parent.body_end) < 0:
         return children
-    for match in PART_INLINE_RE.finditer(parent.body):
+    for match in PART_INLINE_RE.finditer(text[parent.body_start : parent.body_end]):
         name = _strip_quotes(match.group("name"))
         short = _strip_short_name(match.group("short"))
-        types_str = (match.group("types") or "").strip()
-        supertypes = [t.strip() for t in types_str.split(",") if t.strip()]
+        supertypes = _split_types(match.group("types"))
         child = ModelElement(
             kind="part",
             name=name,
@@ -152,10 +135,8 @@ def _extract_nested_parts(parent: ModelElement) -> list[ModelElement]:
             end_index=parent.end_index,
             start_line=parent.start_line,
             end_line=parent.end_line,
-            body="",
-            qualified_name=parent.qualified_name + "::" + name if parent.qualified_name else name,
             doc="",
-            supertypes=supertypes,
+            supertypes=tuple(supertypes),
         )
         children.append(child)
     return children
@@ -3,12 +3,14 @@ from __future__ import annotations
 
 import re
 
+# Possessive quantifiers (Python 3.11+) stop the engine from retrying shorter
+# whitespace, name and tail runs on lines that cannot start a block.
 BLOCK_DECL_RE = re.compile(
-    r"(?m)^(?P<indent>\s*)(?P<kind>package|view|viewpoint|concern|requirement|part|port|interface|constraint|use\s+case|occurrence|action|state|attribute|item|verification|enum)\s+"
+    r"(?m)^(?P<indent>\s*+)(?P<kind>package|view|viewpoint|concern|requirement|part|port|interface|constraint|use\s+case|occurrence|action|state|attribute|item|verification|enum)\s++"
     r"(?:(?:def)\s+)?"
     r"(?:(?:<(?P<short>[^>]+)>)\s+)?"
-    r"(?P<name>'[^']+'|[A-Za-z_][A-Za-z0-9_]*)"
-    r"(?P<tail>[^{;\n]*)\{"
+    r"(?P<name>'[^']+'|[A-Za-z_][A-Za-z0-9_]*+)"
+    r"(?P<tail>[^{;\n]*+)\{"
 )
 
 ID_DECL_RE = re.compile(
@@ -17,47 +19,69 @@ ID_DECL_RE = re.compile(
     r"(?P<name>[A-Z]+_[A-Za-z0-9_]+)\b"
 )
 
-DOC_RE = re.compile(r"doc\s*/\*(?P<doc>.*?)\*/", re.DOTALL)
-EXPOSE_RE = re.compile(r"(?m)^\s*expose\s+(?P<ref>[^;]+);")
-SATISFY_RE = re.compile(r"(?m)^\s*satisfy\s+(?P<ref>[^;]+);")
-FRAME_RE = re.compile(r"(?m)^\s*frame\s+(?P<ref>[^;]+);")
+ID_DECL_KINDS = frozenset({"view", "viewpoint", "concern", "requirement", "part", "state"})
+ID_NAME_RE = re.compile(r"[A-Z]+_[A-Za-z0-9_]+")
+
+# BLOCK_DECL_RE with an ID_DECL_RE fallback branch (id_kind/id_name) for bodiless
+# declarations, so a single pass over a file finds both. A block match is also an ID
+# declaration when its kind is in ID_DECL_KINDS, it has no short name and its bare
+# name fully matches ID_NAME_RE.
+DECL_RE = re.compile(
+    BLOCK_DECL_RE.pattern
+    + r"|^\s*+(?P<id_kind>view|viewpoint|concern|requirement|part|state)\s++"
+    r"(?:(?:def)\s+)?"
+    r"(?P<id_name>[A-Z]+_[A-Za-z0-9_]+)\b"
+)
+
+# Comment bodies are matched up to the first "*/" by an unrolled loop (runs of
+# non-stars, then stars not followed by "/") instead of a lazy DOTALL ".*?", which
+# tries the terminator at every character.
+_COMMENT_BODY = r"[^*]*+(?:\*+(?!/)[^*]*+)*+"
+
+DOC_RE = re.compile(r"doc\s*/\*(?P<doc>" + _COMMENT_BODY + r")\*/")
+# A run such as [^;]++ that must be followed by the character it excludes is made
+# possessive: backtracking into it can never succeed, so an unterminated statement
+# fails after one scan instead of retrying every shorter run.
+EXPOSE_RE = re.compile(r"(?m)^\s*expose\s+(?P<ref>[^;]++);")
+SATISFY_RE = re.compile(r"(?m)^\s*satisfy\s+(?P<ref>[^;]++);")
+FRAME_RE = re.compile(r"(?m)^\s*frame\s+(?P<ref>[^;]++);")
 RENDER_RE = re.compile(r"(?m)^\s*render\s+as(?P<kind>[A-Za-z0-9_]+)\s*;")
 ATTRIBUTE_RE = re.compile(
     r"(?m)^\s*attribute\s+"
     r"(?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\[\*\])?)"
-    r"\s*:\s*(?P<type>[^;{]+);"
+    r"\s*:\s*(?P<type>[^;{]++);"
 )
 ATTRIBUTE_NO_SEMICOLON_RE = re.compile(
     r"(?m)^\s*attribute\s+"
     r"(?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\[\*\])?)"
-    r"\s*:\s*(?P<type>[^{]+)\s*\{\s*doc\s*/\*.*?\*/\s*\}",
+    r"\s*:\s*(?P<type>[^{]++)\s*\{\s*doc\s*/\*.*?\*/\s*\}",
 )
 # constant name : Type = value (value up to ; or {)
 CONSTANT_RE = re.compile(
     r"(?m)^\s*constant\s+"
     r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
-    r"\s*:\s*(?P<type>[^=]+)=\s*(?P<value>[^;{]+?)\s*[;{]",
+    r"\s*:\s*(?P<type>[^=]++)=\s*(?P<value>[^;{]+?)\s*[;{]",
 )
 ALIAS_RE = re.compile(r"(?m)^\s*alias\s+(?P<alias>[A-Za-z_][A-Za-z0-9_]*)\s+for\s+(?P<target>[A-Za-z_][A-Za-z0-9_]*)\s*;")
 FLOW_PROPERTY_RE = re.compile(
     r"(?m)^\s*(?P<dir>in|out)\s+(?P<kind>item|attribute)\s+"
-    r"(?P<name>[A-Za-z_][A-Za-z0-9_']*)\s*:\s*(?P<type>[^;]+);"
+    r"(?P<name>[A-Za-z_][A-Za-z0-9_']*)\s*:\s*(?P<type>[^;]++);"
 )
 INTERFACE_END_RE = re.compile(
     r"(?m)^\s*end\s+(?P<role>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<port_type>[A-Za-z_][A-Za-z0-9_]*)\s*;"
 )
 ALLOCATION_SATISFY_RE = re.compile(
-    r"(?m)^\s*satisfy\s+requirement\s+'([^']+)'\s+by\s+([^;]+);"
+    r"(?m)^\s*satisfy\s+requirement\s+'([^']+)'\s+by\s+([^;]++);"
 )
 REFINEMENT_DEPENDENCY_RE = re.compile(
     r"(?m)#refinement\s+dependency\s+'([^']+)'\s+to\s+'([^']+)';"
 )
 PART_INLINE_RE = re.compile(
     r"(?m)^\s*part\s+(?::>>\s*)?(?:<(?P<short>[^>]+)>)?\s*"
-    r"(?P<name>'[^']+'|[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<types>[^;]+);"
+    r"(?P<name>'[^']+'|[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<types>[^;]++);"
 )
 CONSTRAINT_PARAM_RE = re.compile(
-    r"(?m)^\s*in\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;]+);"
+    r"(?m)^\s*in\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;]++);"
 )
 ATTR_VALUE_ASSIGN_RE = re.compile(r"attribute\s+::>\s+value\s*=\s*([\d.]+)")
 ATTR_WEIGHT_ASSIGN_RE = re.compile(r"attribute\s+::>\s+weight\s*=\s*([\d.]+)")
@@ -96,19 +120,28 @@ DO_ACTION_RE = re.compile(
 )
 
 STATE_PORT_RE = re.compile(
-    r"(?m)^\s*(?P<dir>in|out)\s+(?P<name>'[^']+'|[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;{]+);"
+    r"(?m)^\s*(?P<dir>in|out)\s+(?P<name>'[^']+'|[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;{]++);"
 )
 
 ACTION_USAGE_RE = re.compile(
-    r"(?m)^\s*action\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;{]+);"
+    r"(?m)^\s*action\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;{]++);"
 )
 
 PERFORM_ACTION_RE = re.compile(
-    r"(?m)^\s*perform\s+action\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;{]+);"
+    r"(?m)^\s*perform\s+action\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<type>[^;{]++);"
 )
 
 ACTION_PARAM_RE = re.compile(
-    r"(?m)^\s*(?P<dir>in|out)\s+(?:attribute\s+)?(?::>\s*)?(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*(?::\s*(?P<type>[^;{]+))?\s*;"
+    r"(?m)^\s*(?P<dir>in|out)\s+(?:attribute\s+)?(?::>\s*)?(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*(?::\s*(?P<type>[^;{]++))?\s*;"
+)
+
+# ATTR_DEF_SIGNAL_RE | ACTION_USAGE_RE | STATE_DEF_RE as one pass over a file; the
+# lookahead rejects lines that start with none of the three keywords.
+STANDALONE_DECL_RE = re.compile(
+    r"(?m)^\s*+(?=attribute\s|action\s|state\s)"
+    r"(?:attribute\s+def\s+(?P<signal>[A-Za-z_][A-Za-z0-9_]*)\s*;"
+    r"|action\s+(?P<action>[A-Za-z_][A-Za-z0-9_]*)\s*:\s*(?P<action_type>[^;{]++);"
+    r"|state\s+def\s+(?P<state>[A-Za-z_][A-Za-z0-9_]*)\s*;)"
 )
 
 INLINE_STATE_RE = re.compile(
@@ -122,7 +155,7 @@ STATE_DEF_RE = re.compile(
 # Verification case: objective { verify <requirement>; }
 VERIFY_REF_RE = re.compile(r"verify\s+([A-Za-z0-9_:]+)\s*;")
 # Verification case: subject <name> : <type>;
-SUBJECT_RE = re.compile(r"(?m)^\s*subject\s+([A-Za-z_][A-Za-z0-9_]*)\s*:\s*([^;]+);")
+SUBJECT_RE = re.compile(r"(?m)^\s*subject\s+([A-Za-z_][A-Za-z0-9_]*)\s*:\s*([^;]++);")
 
 # exhibit state <usage_name>; or exhibit <usage_name> { ... }
 EXHIBIT_RE = re.compile(
@@ -136,7 +169,6 @@ ENUM_LITERAL_RE = re.compile(
 
 # SysML v2 named rep blocks: rep <name> language "lang" /* body */
 NAMED_REP_RE = re.compile(
-    r"rep\s+(\w+)\s+language\s+\"([^\"]+)\"\s*/\*(.*?)\*/",
-    re.DOTALL,
+    r"rep\s+(\w+)\s+language\s+\"([^\"]+)\"\s*/\*(" + _COMMENT_BODY + r")\*/"
 )
 TEXTUAL_REPRESENTATION_RE = NAMED_REP_RE
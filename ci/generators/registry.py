@@ -23,6 +23,10 @@ class TargetRegistry:
 
     def get(self, name: str) -> GeneratorTarget:
         """Look up a target by name (case-insensitive)."""
+        # Registered keys are already normalised, so an exact hit needs no normalising.
+        target = self._targets.get(name)
+        if target is not None:
+            return target
         key = name.lower().strip()
         if key not in self._targets:
             supported = ", ".join(sorted(self._targets)) or "<none>"
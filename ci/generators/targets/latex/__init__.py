@@ -8,7 +8,14 @@ from ...errors import ValidationError
 from ...ir import DocumentIR, ModelGraph
 from ...registry import register_target
 from ...templates import copy_asset
-from .assets import STYLE_FILE_NAME, TEX4HT_CFG_NAME, _style_template_path, _template_dir, _try_convert_svg_to_pdf
+from .assets import (
+    STYLE_FILE_NAME,
+    TEX4HT_CFG_NAME,
+    _list_template_files,
+    _style_template_path,
+    _template_dir,
+    _try_convert_svg_to_pdf,
+)
 from .document import _build_tex, _filename_for_document
 
 
@@ -27,7 +34,10 @@ class LatexGenerator(GeneratorTarget):
         output_dir.mkdir(parents=True, exist_ok=True)
 
         style_source = _style_template_path()
-        if not style_source.exists():
+        template_dir = style_source.parent
+        # One directory listing answers every "does this asset exist?" question below.
+        template_files = _list_template_files(template_dir)
+        if style_source.name not in template_files:
             raise ValueError(f"Missing LaTeX style template: {style_source}")
 
         artifacts: list[GeneratedArtifact] = []
@@ -35,27 +45,34 @@ class LatexGenerator(GeneratorTarget):
         style_artifact = copy_asset(style_source, output_dir, artifact_type="style")
         artifacts.append(style_artifact)
 
-        template_dir = style_source.parent
         logo_svg = template_dir / "lyrebird-logo.svg"
         logo_pdf = template_dir / "lyrebird-logo.pdf"
-        if logo_svg.exists():
+        if logo_svg.name in template_files:
             copy_asset(logo_svg, output_dir, artifact_type="logo-svg")
-        if logo_pdf.exists():
+        if logo_pdf.name in template_files:
             copy_asset(logo_pdf, output_dir, artifact_type="logo-pdf")
         else:
             _try_convert_svg_to_pdf(logo_svg, output_dir / "lyrebird-logo.pdf")
 
-        tex4ht_cfg = _template_dir() / TEX4HT_CFG_NAME
-        if tex4ht_cfg.exists():
+        tex4ht_dir = _template_dir()
+        tex4ht_files = template_files if tex4ht_dir == template_dir else _list_template_files(tex4ht_dir)
+        tex4ht_cfg = tex4ht_dir / TEX4HT_CFG_NAME
+        if tex4ht_cfg.name in tex4ht_files:
             tex4ht_artifact = copy_asset(tex4ht_cfg, output_dir, artifact_type="tex4ht-config")
             artifacts.append(tex4ht_artifact)
 
-        filename_map: dict[str, list[str]] = {}
+        # Lists of clashing document IDs are only built once a filename repeats.
+        seen: dict[str, str] = {}
+        collisions: dict[str, list[str]] = {}
+        named: list[tuple[DocumentIR, str]] = []
         for document in documents:
             filename = _filename_for_document(document)
-            filename_map.setdefault(filename, []).append(document.document_id)
-
-        collisions = {name: ids for name, ids in filename_map.items() if len(ids) > 1}
+            named.append((document, filename))
+            previous = seen.get(filename)
+            if previous is None:
+                seen[filename] = document.document_id
+            else:
+                collisions.setdefault(filename, [previous]).append(document.document_id)
         if collisions:
             lines = []
             for name, ids in sorted(collisions.items()):
@@ -69,8 +86,8 @@ class LatexGenerator(GeneratorTarget):
             )
             raise ValidationError(message)
 
-        for document in sorted(documents, key=lambda item: item.document_id):
-            filename = _filename_for_document(document)
+        named.sort(key=lambda item: item[0].document_id)
+        for document, filename in named:
             output_path = output_dir / filename
             output_path.write_text(_build_tex(document, options.version), encoding="utf-8")
             artifacts.append(
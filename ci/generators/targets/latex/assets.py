@@ -1,7 +1,9 @@
 """Asset and template path helpers for the LaTeX target."""
 from __future__ import annotations
 
+import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from ...templates import get_template_dir, select_first_existing
@@ -10,6 +12,7 @@ STYLE_FILE_NAME = "lyrebird-doc-style.sty"
 TEX4HT_CFG_NAME = "lyrebird-html.cfg"
 
 
+@lru_cache(maxsize=None)
 def _template_dir() -> Path:
     """Return the template directory for the LaTeX target."""
     return get_template_dir("latex")
@@ -27,6 +30,15 @@ def _style_template_path() -> Path:
     return select_first_existing(candidates)
 
 
+def _list_template_files(directory: Path) -> frozenset[str]:
+    """Return the names of the files in *directory* from a single scandir (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
+
 def _try_convert_svg_to_pdf(svg_path: Path, pdf_path: Path) -> None:
     """Convert SVG to PDF for pdflatex if rsvg-convert or similar is available."""
     if not svg_path.exists():
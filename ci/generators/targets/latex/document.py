@@ -22,17 +22,38 @@ from .traceability import (
     _render_parametric_constraints_table,
 )
 
+_PREAMBLE = (
+    "\\documentclass[11pt]{article}",
+    "\\usepackage{longtable}",
+    f"\\usepackage{{{STYLE_FILE_NAME.removesuffix('.sty')}}}",
+    "",
+    "\\begin{document}",
+)
+
+# Document-specific renderers, looked up once per document: a titled subsection
+# emitted before the sections, and tables appended to every section.
+_DOCUMENT_SUBSECTIONS = {
+    "DOC_PIM_Allocation": ("Traceability Matrix", _render_allocation_traceability_matrix),
+}
+_SECTION_RENDERERS = {
+    "DOC_PIM_InterfaceDesign": (_render_boundary_ports_and_interfaces,),
+    "DOC_PIM_Verification": (_render_parametric_constraints_table,),
+    "DOC_PSM_PlatformRealization": (_render_technology_selection_table,),
+}
+
+# Kinds left out of a section's element table; the verification document also
+# renders constraints in its own parametric table.
+_SECTION_EXCLUDED_KINDS = frozenset({"package", "use case", "port", "interface"})
+_VERIFICATION_EXCLUDED_KINDS = _SECTION_EXCLUDED_KINDS | {"constraint"}
+_GATEWAY_SIGNOFF_IDS = frozenset({"DOC_CIM_GatewaySignoff", "DOC_PIM_GatewaySignoff"})
+
 
 def _build_tex(document: DocumentIR, version: str) -> str:
     lines = [
         "% Auto-generated from SysML views",
         f"% Source: {document.source.file_path}",
         "% Build from the output directory so lyrebird-doc-style.sty is found, or run the generator first.",
-        "\\documentclass[11pt]{article}",
-        "\\usepackage{longtable}",
-        f"\\usepackage{{{STYLE_FILE_NAME.removesuffix('.sty')}}}",
-        "",
-        "\\begin{document}",
+        *_PREAMBLE,
         (
             f"\\LyrebirdDocumentTitle{{{_escape_latex(document.title)}}}"
             f"{{{_escape_latex(document.document_id)}}}"
@@ -45,93 +66,67 @@ def _build_tex(document: DocumentIR, version: str) -> str:
         "\\subsection{Metadata}",
         "\\begin{itemize}",
         f"\\item Document ID: \\texttt{{{_escape_latex(document.document_id)}}}",
-        f"\\item Abstraction Level: {_escape_latex(document.abstraction_level)}",
+        f"\\item Abstraction Level: {document.abstraction_level}",
         f"\\item Source Lines: {document.source.start_line}--{document.source.end_line}",
         f"\\item Render Directive: \\texttt{{{_escape_latex(document.binding.render_kind or 'unspecified')}}}",
         "\\end{itemize}",
         "",
     ]
+    append = lines.append
+    extend = lines.extend
     if document.purpose:
-        lines.append("\\subsection{Purpose}")
-        lines.append(_escape_latex(document.purpose))
-        lines.append("")
-
-    if document.document_id == "DOC_PIM_Allocation":
-        matrix_tex = _render_allocation_traceability_matrix(document)
-        if matrix_tex:
-            lines.append("\\subsection{Traceability Matrix}")
-            lines.append("")
-            lines.append(matrix_tex)
-            lines.append("")
+        extend(("\\subsection{Purpose}", _escape_latex(document.purpose), ""))
+
+    subsection = _DOCUMENT_SUBSECTIONS.get(document.document_id)
+    if subsection is not None:
+        subsection_title, render_subsection = subsection
+        subsection_tex = render_subsection(document)
+        if subsection_tex:
+            extend((f"\\subsection{{{subsection_title}}}", "", subsection_tex, ""))
 
     if document.sections:
+        document_id = document.document_id
+        section_renderers = _SECTION_RENDERERS.get(document_id, ())
+        exclude_kinds = (
+            _VERIFICATION_EXCLUDED_KINDS
+            if document_id == "DOC_PIM_Verification"
+            else _SECTION_EXCLUDED_KINDS
+        )
+        is_gateway_signoff_doc = document_id in _GATEWAY_SIGNOFF_IDS
+        is_platform_realization_doc = document_id == "DOC_PSM_PlatformRealization"
         for section in document.sections:
             heading_cmd = _heading_for_depth(section.depth)
-            is_signoff_section = (
+            is_gateway_signoff_section = is_gateway_signoff_doc and (
                 section.title.strip().lower() == "stakeholder signoff"
                 or getattr(section, "id", "") == "SignoffSection"
             )
-            is_gateway_signoff_doc = document.document_id in (
-                "DOC_CIM_GatewaySignoff",
-                "DOC_PIM_GatewaySignoff",
-            )
-            heading_text = (
-                "Stakeholder Signoff"
-                if (is_signoff_section and is_gateway_signoff_doc)
-                else section.title
-            )
-            lines.append(f"{heading_cmd}{{{_escape_latex(heading_text)}}}")
+            heading_text = "Stakeholder Signoff" if is_gateway_signoff_section else section.title
+            append(f"{heading_cmd}{{{_escape_latex(heading_text)}}}")
             if section.intro:
-                lines.append(_escape_latex(section.intro))
-                lines.append("")
+                extend((_escape_latex(section.intro), ""))
 
-            if is_signoff_section and is_gateway_signoff_doc:
-                lines.append(_render_stakeholder_signoff_table(document))
-                lines.append("")
+            if is_gateway_signoff_section:
+                extend((_render_stakeholder_signoff_table(document), ""))
                 continue
 
-            if document.document_id == "DOC_PIM_InterfaceDesign":
-                boundary_tex = _render_boundary_ports_and_interfaces(section)
-                if boundary_tex:
-                    lines.append(boundary_tex)
-                    lines.append("")
-
-            if document.document_id == "DOC_PIM_Verification":
-                param_tex = _render_parametric_constraints_table(section)
-                if param_tex:
-                    lines.append(param_tex)
-                    lines.append("")
-
-            if document.document_id == "DOC_PSM_PlatformRealization":
-                tech_tex = _render_technology_selection_table(section)
-                if tech_tex:
-                    lines.append(tech_tex)
-                    lines.append("")
-
-            is_interface_bindings_section = (
+            for render_section in section_renderers:
+                section_tex = render_section(section)
+                if section_tex:
+                    extend((section_tex, ""))
+
+            if is_platform_realization_doc and (
                 section.title.strip() == "Interface Bindings"
                 or getattr(section, "id", "") == "InterfaceBindingsSection"
-            )
-            if document.document_id == "DOC_PSM_PlatformRealization" and is_interface_bindings_section:
+            ):
                 psm_if_tex = _render_psm_interface_bindings(section)
                 if psm_if_tex:
-                    lines.append(psm_if_tex)
-                    lines.append("")
+                    extend((psm_if_tex, ""))
                 continue
 
-            exclude_kinds = {"package", "use case", "port", "interface"}
-            if document.document_id == "DOC_PIM_Verification":
-                exclude_kinds = exclude_kinds | {"constraint"}
-            section_items = [
-                e for e in section.exposed_elements if e.kind not in exclude_kinds
-            ]
-            if section_items:
-                lines.append(_render_section_elements_table(section))
-                lines.append("")
+            if any(e.kind not in exclude_kinds for e in section.exposed_elements):
+                extend((_render_section_elements_table(section), ""))
     else:
-        lines.append("\\subsection{Model View Content}")
-        lines.append(_render_exposed_package_structure(document))
-        lines.append("")
+        extend(("\\subsection{Model View Content}", _render_exposed_package_structure(document), ""))
 
     events = [
         e
@@ -139,28 +134,19 @@ def _build_tex(document: DocumentIR, version: str) -> str:
         if e.kind == "occurrence" and e.qualified_name.startswith("CIM::Events::")
     ]
     if events:
-        lines.append("\\subsection{Events}")
-        lines.append(_render_events_table(events))
-        lines.append("")
+        extend(("\\subsection{Events}", _render_events_table(events), ""))
 
     use_cases = [e for e in document.exposed_elements if e.kind == "use case"]
     if use_cases:
         for use_case in sorted(use_cases, key=lambda item: item.name):
-            lines.append(f"\\begin{{usecase}}{{{_escape_latex(use_case.name)}}}")
+            append(f"\\begin{{usecase}}{{{_escape_latex(use_case.name)}}}")
             if use_case.doc:
                 for raw_line in use_case.doc.splitlines():
                     clean = raw_line.strip()
-                    if clean:
-                        lines.append(f"{_escape_latex(clean)}\\\\")
-                    else:
-                        lines.append("")
-            lines.append("\\end{usecase}")
-            lines.append("")
-
-    lines.append("\\subsection{Render Directive Snapshot}")
-    lines.append(_render_element_table(document))
-    lines.append("")
-    lines.append("\\end{document}")
+                    append(f"{_escape_latex(clean)}\\\\" if clean else "")
+            extend(("\\end{usecase}", ""))
+
+    extend(("\\subsection{Render Directive Snapshot}", _render_element_table(document), "", "\\end{document}"))
     return "\n".join(lines)
 
 
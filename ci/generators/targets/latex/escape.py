@@ -2,14 +2,25 @@
 from __future__ import annotations
 
 import re
-
-LATEX_SPECIAL_RE = re.compile(r"([\\{}$&#_%~^])")
+from functools import lru_cache
+
+# Applied in order: the backslash goes first because the later escapes insert
+# backslashes, and the angle brackets go last because their commands contain braces.
+_LATEX_ESCAPES = (
+    *((c, "\\" + c) for c in "\\{}$&#_%~^"),
+    ("<", "\\textless{}"),
+    (">", "\\textgreater{}"),
+)
 LABEL_SAFE_RE = re.compile(r"[^a-z0-9:-]+")
 
 
+# Titles, IDs and element names repeat across sections and documents.
+@lru_cache(maxsize=8192)
 def _escape_latex(value: str) -> str:
-    escaped = LATEX_SPECIAL_RE.sub(r"\\\1", value)
-    return escaped.replace("<", "\\textless{}").replace(">", "\\textgreater{}")
+    for char, escaped in _LATEX_ESCAPES:
+        if char in value:
+            value = value.replace(char, escaped)
+    return value
 
 
 def _doc_slug(document_id: str) -> str:
@@ -19,4 +30,7 @@ def _doc_slug(document_id: str) -> str:
 
 def _label_key(document_id: str) -> str:
     key = document_id.lower().replace("_", "-")
+    # IDs such as DOC_CIM_SNRS are already label-safe once lowered; skip the regex pass.
+    if key.isascii() and key.replace("-", "").replace(":", "").isalnum():
+        return key.strip("-")
     return LABEL_SAFE_RE.sub("-", key).strip("-")
@@ -1,4 +1,4 @@
-"""Rendering helpers: heading, qname, directive-based views, package structure."""
+"""Rendering helpers: heading, directive-based views, package structure."""
 from __future__ import annotations
 
 from ...ir import DocumentIR, ExposedElement
@@ -13,10 +13,6 @@ def _heading_for_depth(depth: int) -> str:
     return "\\subsubsection"
 
 
-def _qname(parts: tuple[str, ...]) -> str:
-    return "::".join(parts)
-
-
 def _render_element_table(document: DocumentIR) -> str:
     rows = [
         "\\begin{tabular}{|l|p{11cm}|}",
@@ -27,11 +23,9 @@ def _render_element_table(document: DocumentIR) -> str:
         "\\hline",
     ]
     for ref in sorted(document.binding.expose_refs):
-        rows.append(f"Expose Ref & \\texttt{{{_escape_latex(ref)}}} \\\\")
-        rows.append("\\hline")
+        rows.append(f"Expose Ref & \\texttt{{{_escape_latex(ref)}}} \\\\\n\\hline")
     for ref in sorted(document.binding.satisfy_refs):
-        rows.append(f"Satisfy Ref & \\texttt{{{_escape_latex(ref)}}} \\\\")
-        rows.append("\\hline")
+        rows.append(f"Satisfy Ref & \\texttt{{{_escape_latex(ref)}}} \\\\\n\\hline")
     rows.append("\\end{tabular}")
     return "\n".join(rows)
 
@@ -71,40 +65,44 @@ def _render_exposed_package_structure(document: DocumentIR) -> str:
     if not elements:
         return "\\subsection{Exposed Model Elements}\nNo exposed elements resolved."
 
-    package_doc_by_qname: dict[str, str] = {}
+    package_doc_by_path: dict[tuple[str, ...], str] = {}
     package_nodes: set[tuple[str, ...]] = set()
     members_by_package: dict[tuple[str, ...], list[ExposedElement]] = {}
+    children_by_parent: dict[tuple[str, ...] | None, list[tuple[str, ...]]] = {}
 
     for element in elements:
-        for depth in range(1, len(element.package_path) + 1):
-            package_nodes.add(element.package_path[:depth])
-
         if element.kind == "package":
-            package_nodes.add(element.package_path + (element.name,))
-            package_doc_by_qname[element.qualified_name] = element.doc
+            package_path = element.package_path + (element.name,)
+            package_doc_by_path[package_path] = element.doc
         else:
-            members_by_package.setdefault(element.package_path, []).append(element)
-
-    children_by_parent: dict[tuple[str, ...] | None, list[tuple[str, ...]]] = {}
-    for package_path in package_nodes:
-        parent = package_path[:-1] if len(package_path) > 1 else None
-        children_by_parent.setdefault(parent, []).append(package_path)
-
-    for parent in children_by_parent:
-        children_by_parent[parent].sort(key=lambda item: _qname(item))
+            package_path = element.package_path
+            members_by_package.setdefault(package_path, []).append(element)
+
+        # Each package path prefix becomes a tree node, filed under its parent when first seen.
+        for depth in range(1, len(package_path) + 1):
+            node = package_path[:depth]
+            if node not in package_nodes:
+                package_nodes.add(node)
+                children_by_parent.setdefault(node[:-1] if depth > 1 else None, []).append(node)
+
+    # Siblings share their parent's path, so tuple order matches "::"-joined name order.
+    for children in children_by_parent.values():
+        children.sort()
     for package_path in members_by_package:
         members_by_package[package_path].sort(key=lambda item: item.qualified_name)
 
     lines: list[str] = []
-
-    def render_package(package_path: tuple[str, ...], depth: int) -> None:
+    # Depth-first, children in sorted order: pop the next package, push its children reversed.
+    stack = [(root, 0) for root in reversed(children_by_parent.get(None, []))]
+    while stack:
+        package_path, depth = stack.pop()
         heading = _heading_for_depth(depth)
         package_name = package_path[-1]
-        qname_str = _qname(package_path)
+        package_doc = package_doc_by_path.get(package_path)
 
         lines.append(f"{heading}{{{_escape_latex(package_name)}}}")
-        if qname_str in package_doc_by_qname and package_doc_by_qname[qname_str]:
-            lines.append(_escape_latex(package_doc_by_qname[qname_str]))
+        if package_doc:
+            lines.append(_escape_latex(package_doc))
             lines.append("")
 
         members = members_by_package.get(package_path, [])
@@ -118,11 +116,9 @@ def _render_exposed_package_structure(document: DocumentIR) -> str:
             lines.append("\\end{itemize}")
             lines.append("")
 
-        for child in children_by_parent.get(package_path, []):
-            render_package(child, depth + 1)
-
-    for root in children_by_parent.get(None, []):
-        render_package(root, 0)
+        children = children_by_parent.get(package_path)
+        if children:
+            stack.extend((child, depth + 1) for child in reversed(children))
 
     return "\n".join(lines).strip()
 
@@ -155,9 +151,8 @@ def _render_stakeholder_signoff_table(document: DocumentIR) -> str:
     for element in stakeholders:
         role = _escape_latex(element.doc) if element.doc else ""
         lines.append(
-            f"{_escape_latex(element.name)} & {role} & & & \\\\"
+            f"{_escape_latex(element.name)} & {role} & & & \\\\\n\\hline"
         )
-        lines.append("\\hline")
 
     lines.append("\\end{tabular}")
     return "\n".join(lines)
@@ -1,9 +1,17 @@
 """Table renderers: section elements, events, boundary ports/interfaces, PSM bindings."""
 from __future__ import annotations
 
-from ...ir import ExposedElement, SectionIR
+from ...ir import ExposedElement, FlowPropertyIR, SectionIR
 from .escape import _escape_latex
 
+_PSM_INTERFACES_PREFIX = "PSM_Interfaces::"
+# Binding part defs in rendering order, and the error-mapping parts listed after them.
+_PSM_BINDING_ORDER = {
+    name: index
+    for index, name in enumerate(("MLLP Ingress Binding", "HTTP Egress Binding", "Runtime Config Binding"))
+}
+_PSM_ERROR_MAPPING_NAMES = frozenset({"MLLP Error Mapping", "HTTP Response Mapping"})
+
 
 def _parse_type_and_default(type_str: str | None) -> tuple[str, str]:
     """Split attribute type string into base type and default (e.g. 'Integer = 2575 { doc }' -> ('Integer', '2575'))."""
@@ -32,24 +40,18 @@ def _render_section_elements_table(section: SectionIR) -> str:
         "\\endhead",
     ]
     for element in items:
-        cell_parts: list[str] = []
-        if element.doc:
-            cell_parts.append(_escape_latex(element.doc))
-
+        cell_text = _escape_latex(element.doc) if element.doc else ""
         if element.attributes:
-            cell_parts.append("\\begin{itemize}")
-            for attr in element.attributes:
-                type_suffix = f": {attr.type}" if attr.type else ""
-                cell_parts.append(
-                    f"  \\item {_escape_latex(attr.name)}{_escape_latex(type_suffix)}"
-                )
-            cell_parts.append("\\end{itemize}")
-
-        cell_text = " ".join(cell_parts)
+            attr_items = " ".join(
+                f"  \\item {_escape_latex(attr.name)}{_escape_latex(f': {attr.type}') if attr.type else ''}"
+                for attr in element.attributes
+            )
+            itemize = f"\\begin{{itemize}} {attr_items} \\end{{itemize}}"
+            cell_text = f"{cell_text} {itemize}" if cell_text else itemize
+        # Element kinds come from the parser's fixed keyword set and never need escaping.
         lines.append(
-            f"{_escape_latex(element.name)} & {_escape_latex(element.kind)} & {cell_text} \\\\"
+            f"{_escape_latex(element.name)} & {element.kind} & {cell_text} \\\\\n\\hline"
         )
-        lines.append("\\hline")
 
     lines.append("\\end{longtable}")
     return "\n".join(lines)
@@ -70,9 +72,8 @@ def _render_events_table(events: list[ExposedElement]) -> str:
     for event in events:
         desc = _escape_latex(event.doc) if event.doc else ""
         lines.append(
-            f"{_escape_latex(event.name)} & {_escape_latex(event.kind)} & {desc} \\\\"
+            f"{_escape_latex(event.name)} & {event.kind} & {desc} \\\\\n\\hline"
         )
-        lines.append("\\hline")
 
     lines.append("\\end{longtable}")
     return "\n".join(lines)
@@ -80,8 +81,13 @@ def _render_events_table(events: list[ExposedElement]) -> str:
 
 def _render_boundary_ports_and_interfaces(section: SectionIR) -> str:
     """Render boundary port and interface definitions (port name, interface name, flow properties, types) for PIM Interface Design."""
-    ports = [e for e in section.exposed_elements if e.kind == "port"]
-    interfaces = [e for e in section.exposed_elements if e.kind == "interface"]
+    ports: list[ExposedElement] = []
+    interfaces: list[ExposedElement] = []
+    for element in section.exposed_elements:
+        if element.kind == "port":
+            ports.append(element)
+        elif element.kind == "interface":
+            interfaces.append(element)
     if not ports and not interfaces:
         return ""
 
@@ -99,8 +105,15 @@ def _render_boundary_ports_and_interfaces(section: SectionIR) -> str:
         lines.append("\\hline")
         lines.append("\\endhead")
         for port in ports:
-            items = [fp for fp in port.flow_properties if fp.kind == "item"]
-            signals = [fp for fp in port.flow_properties if fp.kind == "attribute"]
+            items: list[FlowPropertyIR] = []
+            signals: list[FlowPropertyIR] = []
+            dirs: set[str] = set()
+            for fp in port.flow_properties:
+                dirs.add(fp.direction)
+                if fp.kind == "item":
+                    items.append(fp)
+                elif fp.kind == "attribute":
+                    signals.append(fp)
             item_str = ", ".join(
                 f"{_escape_latex(fp.name)}: {_escape_latex(fp.type or '')}"
                 for fp in items
@@ -109,12 +122,10 @@ def _render_boundary_ports_and_interfaces(section: SectionIR) -> str:
                 f"{_escape_latex(fp.name)}: {_escape_latex(fp.type or '')}"
                 for fp in signals
             ) or "---"
-            dirs = {fp.direction for fp in port.flow_properties}
             dir_str = ", ".join(sorted(dirs)) if dirs else "---"
             lines.append(
-                f"{_escape_latex(port.name)} & {_escape_latex(dir_str)} & {_escape_latex(item_str)} & {_escape_latex(signal_str)} \\\\"
+                f"{_escape_latex(port.name)} & {_escape_latex(dir_str)} & {_escape_latex(item_str)} & {_escape_latex(signal_str)} \\\\\n\\hline"
             )
-            lines.append("\\hline")
         lines.append("\\end{longtable}")
         lines.append("")
 
@@ -133,9 +144,10 @@ def _render_boundary_ports_and_interfaces(section: SectionIR) -> str:
             supplier = ""
             consumer = ""
             for e in iface.interface_ends:
-                if "supplier" in e.role.lower():
+                role = e.role.lower()
+                if "supplier" in role:
                     supplier = e.port_type
-                elif "consumer" in e.role.lower():
+                elif "consumer" in role:
                     consumer = e.port_type
             if not supplier and iface.interface_ends:
                 supplier = iface.interface_ends[0].port_type
@@ -143,9 +155,8 @@ def _render_boundary_ports_and_interfaces(section: SectionIR) -> str:
                 consumer = iface.interface_ends[1].port_type
             desc = _escape_latex(iface.doc) if iface.doc else "---"
             lines.append(
-                f"{_escape_latex(iface.name)} & {_escape_latex(supplier)} & {_escape_latex(consumer)} & {desc} \\\\"
+                f"{_escape_latex(iface.name)} & {_escape_latex(supplier)} & {_escape_latex(consumer)} & {desc} \\\\\n\\hline"
             )
-            lines.append("\\hline")
         lines.append("\\end{longtable}")
 
     return "\n".join(lines)
@@ -153,25 +164,20 @@ def _render_boundary_ports_and_interfaces(section: SectionIR) -> str:
 
 def _render_psm_interface_bindings(section: SectionIR) -> str:
     """Render PSM interface bindings: binding part defs with parameter tables (name, type, default), ports/interfaces table, error mappings."""
-    prefix = "PSM_Interfaces::"
-    binding_names = ("MLLP Ingress Binding", "HTTP Egress Binding", "Runtime Config Binding")
-    bindings = [
-        e
-        for e in section.exposed_elements
-        if e.kind == "part"
-        and e.qualified_name.startswith(prefix)
-        and e.name in binding_names
-    ]
-    bindings.sort(key=lambda x: (binding_names.index(x.name) if x.name in binding_names else 99, x.qualified_name))
-    error_mappings = [
-        e
-        for e in section.exposed_elements
-        if e.kind == "part"
-        and e.qualified_name.startswith(prefix)
-        and e.name in ("MLLP Error Mapping", "HTTP Response Mapping")
-    ]
-    ports = [e for e in section.exposed_elements if e.kind == "port" and e.qualified_name.startswith(prefix)]
-    interfaces = [e for e in section.exposed_elements if e.kind == "interface" and e.qualified_name.startswith(prefix)]
+    bindings: list[ExposedElement] = []
+    error_mappings: list[ExposedElement] = []
+    has_ports_or_interfaces = False
+    for e in section.exposed_elements:
+        if not e.qualified_name.startswith(_PSM_INTERFACES_PREFIX):
+            continue
+        if e.kind == "part":
+            if e.name in _PSM_BINDING_ORDER:
+                bindings.append(e)
+            elif e.name in _PSM_ERROR_MAPPING_NAMES:
+                error_mappings.append(e)
+        elif e.kind == "port" or e.kind == "interface":
+            has_ports_or_interfaces = True
+    bindings.sort(key=lambda x: (_PSM_BINDING_ORDER[x.name], x.qualified_name))
 
     lines: list[str] = []
 
@@ -190,12 +196,11 @@ def _render_psm_interface_bindings(section: SectionIR) -> str:
             for attr in binding.attributes:
                 base_type, default = _parse_type_and_default(attr.type)
                 default_tex = _escape_latex(default) if default else "---"
-                lines.append(f"{_escape_latex(attr.name)} & {_escape_latex(base_type)} & {default_tex} \\\\")
-                lines.append("\\hline")
+                lines.append(f"{_escape_latex(attr.name)} & {_escape_latex(base_type)} & {default_tex} \\\\\n\\hline")
             lines.append("\\end{longtable}")
             lines.append("")
 
-    if ports or interfaces:
+    if has_ports_or_interfaces:
         lines.append("\\subsubsection{PSM Ports and Interfaces}")
         lines.append("")
         port_interface_tex = _render_boundary_ports_and_interfaces(section)
@@ -30,8 +30,7 @@ def _render_parametric_constraints_table(section: SectionIR) -> str:
             f"{_escape_latex(name)}: {_escape_latex(typ)}"
             for name, typ in params
         ) if params else "---"
-        lines.append(f"{_escape_latex(c.name)} & {intent} & {param_str} \\\\")
-        lines.append("\\hline")
+        lines.append(f"{_escape_latex(c.name)} & {intent} & {param_str} \\\\\n\\hline")
     lines.append("\\end{longtable}")
     return "\n".join(lines)
 
@@ -53,7 +52,6 @@ def _render_allocation_traceability_matrix(document: DocumentIR) -> str:
         req = _escape_latex(row.requirement)
         block = _escape_latex(row.logical_block)
         cim = _escape_latex(row.cim_derive) if row.cim_derive else "---"
-        lines.append(f"{req} & {block} & {cim} \\\\")
-        lines.append("\\hline")
+        lines.append(f"{req} & {block} & {cim} \\\\\n\\hline")
     lines.append("\\end{longtable}")
     return "\n".join(lines)
@@ -2,11 +2,24 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from operator import mul
 
 from ...ir import ExposedElement, SectionIR
 from .escape import _escape_latex
 
+_ALT_MATCH_DROP_RE = re.compile(r"[^a-z0-9]")
 
+# Known trade studies in rendering order; others follow by name.
+_TRADE_STUDY_ORDER = {
+    name: index
+    for index, name in enumerate(
+        ("LanguageRuntimeTradeStudy", "HL7ParserTradeStudy", "HTTPClientTradeStudy", "DeploymentModelTradeStudy")
+    )
+}
+
+
+@lru_cache(maxsize=256)
 def _humanise_trade_study_name(name: str) -> str:
     """E.g. LanguageRuntimeTradeStudy -> Language Runtime."""
     if name.endswith("TradeStudy"):
@@ -20,19 +33,27 @@ def _humanise_trade_study_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=1024)
 def _normalise_for_alt_match(s: str) -> str:
     """Lowercase, alphanumeric only, for matching scored part names to alternative names."""
-    return re.sub(r"[^a-z0-9]", "", s.lower())
+    return _ALT_MATCH_DROP_RE.sub("", s.lower())
+
 
+def _alternative_match_keys(alternatives: list[ExposedElement]) -> list[tuple[str, ExposedElement]]:
+    """Pair each alternative with its match key (normalised first word of its name), in order."""
+    return [(_normalise_for_alt_match(alt.name.split()[0] if alt.name else ""), alt) for alt in alternatives]
 
-def _match_scored_to_alternative(scored: ExposedElement, alternatives: list[ExposedElement]) -> ExposedElement | None:
+
+def _match_scored_to_alternative(
+    scored: ExposedElement, alternative_keys: list[tuple[str, ExposedElement]]
+) -> ExposedElement | None:
     """Return the alternative element that best matches this scored part (e.g. nodeScored -> Node.js Runtime), or None."""
     key = _normalise_for_alt_match(scored.name.replace("Scored", "").strip())
     if not key:
         return None
-    for alt in alternatives:
-        alt_key = _normalise_for_alt_match(alt.name.split()[0] if alt.name else "")
-        if key == alt_key or key in alt_key or alt_key in key:
+    # The first alternative whose key contains or is contained in the scored key wins (equal keys included).
+    for alt_key, alt in alternative_keys:
+        if key in alt_key or alt_key in key:
             return alt
     return None
 
@@ -42,7 +63,7 @@ def _compute_score(alt: ExposedElement, weights: list[float]) -> str:
     values = getattr(alt, "value_assignments", []) or []
     if not values or not weights or len(values) != len(weights):
         return "---"
-    total = sum(v * w for v, w in zip(values, weights))
+    total = sum(map(mul, values, weights))
     return f"{total:.2f}"
 
 
@@ -59,9 +80,13 @@ def _render_technology_selection_table(section: SectionIR) -> str:
     ]
     if not trade_studies:
         return ""
-    order = ("LanguageRuntimeTradeStudy", "HL7ParserTradeStudy", "HTTPClientTradeStudy", "DeploymentModelTradeStudy")
-    trade_studies.sort(key=lambda p: (order.index(p.name) if p.name in order else 99, p.name))
-    by_qname = {e.qualified_name: e for e in section.exposed_elements}
+    trade_studies.sort(key=lambda p: (_TRADE_STUDY_ORDER.get(p.name, 99), p.name))
+    parts = [e for e in section.exposed_elements if e.kind == "part"]
+    # Scored alternatives are found by supertype; each part is listed once per distinct supertype.
+    parts_by_supertype: dict[str, list[ExposedElement]] = {}
+    for part in parts:
+        for supertype in dict.fromkeys(part.supertypes):
+            parts_by_supertype.setdefault(supertype, []).append(part)
     exclude_alternatives = ("context", "criteria", "criterion", "alternative", "scored", "assessment")
     lines: list[str] = []
     for study in trade_studies:
@@ -72,13 +97,12 @@ def _render_technology_selection_table(section: SectionIR) -> str:
         if study.doc:
             lines.append(_escape_latex(study.doc))
             lines.append("")
+        study_parts = [e for e in parts if e.qualified_name.startswith(study_prefix)]
         scored_def = next(
             (
                 e
-                for e in section.exposed_elements
-                if e.kind == "part"
-                and e.qualified_name.startswith(study_prefix)
-                and "Scored" in e.name
+                for e in study_parts
+                if "Scored" in e.name
                 and "Alternative" in e.name
             ),
             None,
@@ -88,18 +112,13 @@ def _render_technology_selection_table(section: SectionIR) -> str:
         )
         scored_parts = [
             e
-            for e in section.exposed_elements
-            if e.kind == "part"
-            and e.qualified_name.startswith(study_prefix)
-            and scored_short
-            and scored_short in getattr(e, "supertypes", [])
-        ]
+            for e in parts_by_supertype.get(scored_short, ())
+            if e.qualified_name.startswith(study_prefix)
+        ] if scored_short else []
         alternatives = [
             e
-            for e in section.exposed_elements
-            if e.kind == "part"
-            and e.qualified_name.startswith(study_prefix)
-            and e.qualified_name != study_prefix.rstrip(":")
+            for e in study_parts
+            if e.qualified_name != study_prefix.rstrip(":")
             and not any(x in e.name.lower() for x in exclude_alternatives)
         ]
         alternatives.sort(key=lambda e: e.name)
@@ -107,10 +126,8 @@ def _render_technology_selection_table(section: SectionIR) -> str:
         criteria_def = next(
             (
                 e
-                for e in section.exposed_elements
-                if e.kind == "part"
-                and e.qualified_name.startswith(study_prefix)
-                and "Assessment" in e.name
+                for e in study_parts
+                if "Assessment" in e.name
                 and "Criteria" in e.name
             ),
             None,
@@ -125,24 +142,22 @@ def _render_technology_selection_table(section: SectionIR) -> str:
             lines.append("\\hline")
             lines.append("\\endhead")
             seen_alt_qnames: set[str] = set()
+            alternative_keys = _alternative_match_keys(alternatives)
             for sp in scored_parts:
-                alt_el = _match_scored_to_alternative(sp, alternatives)
+                alt_el = _match_scored_to_alternative(sp, alternative_keys)
                 key = (alt_el.qualified_name if alt_el else sp.qualified_name)
                 if key in seen_alt_qnames:
                     continue
                 seen_alt_qnames.add(key)
                 alt_name = _escape_latex(alt_el.name if alt_el else sp.name)
                 score_val = _compute_score(alt_el, weights) if alt_el else "---"
-                lines.append(f"{alt_name} & {score_val} \\\\")
-                lines.append("\\hline")
+                lines.append(f"{alt_name} & {score_val} \\\\\n\\hline")
             lines.append("\\end{longtable}")
             lines.append("")
         context_parts = [
             e
-            for e in section.exposed_elements
-            if e.kind == "part"
-            and e.qualified_name.startswith(study_prefix)
-            and "context" in e.name.lower()
+            for e in study_parts
+            if "context" in e.name.lower()
         ]
         if context_parts:
             ctx = context_parts[0]
@@ -26,7 +26,7 @@ from .config import (
     _build_tsconfig,
     generated_ts_header,
 )
-from .queries import get_component_map
+from .queries import clear_component_map_cache, get_component_map
 
 
 class TypeScriptGenerator(GeneratorTarget):
@@ -38,6 +38,17 @@ class TypeScriptGenerator(GeneratorTarget):
         self,
         graph: ModelGraph,
         options: GenerationOptions,
+    ) -> list[GeneratedArtifact]:
+        try:
+            return self._generate(graph, options)
+        finally:
+            # Component maps are memoized for one run; do not keep the graph alive after it.
+            clear_component_map_cache()
+
+    def _generate(
+        self,
+        graph: ModelGraph,
+        options: GenerationOptions,
     ) -> list[GeneratedArtifact]:
         output_dir = Path(options.output_dir)
         src_dir = output_dir / "src"
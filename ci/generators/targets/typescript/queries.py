@@ -314,6 +314,18 @@ def _find_root_adapter_from_exposed(
     return (None, None)
 
 
+# Component maps per (graph, document), for the graph most recently queried. Generators and
+# their helpers ask for the same map many times per run, and the graph is not mutated once
+# built. Entries hold the graph and document themselves so a recycled id() can never match;
+# the generators call clear_component_map_cache() when a run ends so they are not kept alive.
+_COMPONENT_MAP_CACHE: dict[tuple[int, int], tuple[ModelGraph, object | None, list[dict[str, str]]]] = {}
+
+
+def clear_component_map_cache() -> None:
+    """Forget all memoized component maps."""
+    _COMPONENT_MAP_CACHE.clear()
+
+
 def get_component_map(
     graph: ModelGraph,
     document: object | None = None,
@@ -323,7 +335,19 @@ def get_component_map(
     For each child part of the adapter, resolves its part def, walks the
     supertype chain to find the exhibit edge, and derives the state machine
     usage name, output filename, and class name from the model.
+    Every call returns fresh dicts, so callers may modify them.
     """
+    key = (id(graph), id(document))
+    cached = _COMPONENT_MAP_CACHE.get(key)
+    if cached is None or cached[0] is not graph or cached[1] is not document:
+        if any(entry[0] is not graph for entry in _COMPONENT_MAP_CACHE.values()):
+            _COMPONENT_MAP_CACHE.clear()
+        cached = (graph, document, _build_component_map(graph, document))
+        _COMPONENT_MAP_CACHE[key] = cached
+    return [dict(comp) for comp in cached[2]]
+
+
+def _build_component_map(graph: ModelGraph, document: object | None) -> list[dict[str, str]]:
     if document is not None and getattr(document, "exposed_elements", None):
         adapter_part_def_qname, _ = _find_root_adapter_from_exposed(
             graph, document.exposed_elements
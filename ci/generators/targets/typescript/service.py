@@ -88,13 +88,17 @@ def _build_service_module(graph: ModelGraph, document: object | None = None) ->
     machine_node = graph.get(machine_qname)
     initial_state = machine_node.properties.get("entry_target") if machine_node else "Idle"
 
+    # Each component's PSM node and config attributes, resolved once for the loops below.
+    comp_configs = []
+    for comp in component_map:
+        psm = _find_psm_node(graph, comp["psm_short"], comp.get("part_def_qname"))
+        comp_configs.append((comp, psm, _get_config_attributes(psm) if psm else []))
+
     lines: list[str] = []
 
     imports: list[str] = []
-    for comp in component_map:
+    for comp, psm, attrs in comp_configs:
         module = comp["output_file"].replace(".ts", "")
-        psm = _find_psm_node(graph, comp["psm_short"], comp.get("part_def_qname"))
-        attrs = _get_config_attributes(psm) if psm else []
         if attrs:
             imports.append(f"import {{ {comp['class_name']}, {comp['class_name']}Config }} from './{module}';")
         else:
@@ -150,16 +154,12 @@ def _build_service_module(graph: ModelGraph, document: object | None = None) ->
     lines.append("")
 
     constructor_params: list[str] = []
-    for comp in component_map:
-        psm = _find_psm_node(graph, comp["psm_short"], comp.get("part_def_qname"))
-        attrs = _get_config_attributes(psm) if psm else []
+    for comp, psm, attrs in comp_configs:
         if attrs:
             constructor_params.append(f"{_to_camel(comp['class_name'])}Config: {comp['class_name']}Config")
 
     config_imports: list[str] = []
-    for comp in component_map:
-        psm = _find_psm_node(graph, comp["psm_short"], comp.get("part_def_qname"))
-        attrs = _get_config_attributes(psm) if psm else []
+    for comp, psm, attrs in comp_configs:
         if attrs:
             config_imports.append(f"{comp['class_name']}Config")
 
@@ -177,11 +177,9 @@ def _build_service_module(graph: ModelGraph, document: object | None = None) ->
     )
     provider_field = _to_camel(provider_comp["class_name"]) if provider_comp else None
 
-    for comp in component_map:
+    for comp, psm, attrs in comp_configs:
         field = _to_camel(comp["class_name"])
         config_param = _to_camel(comp["class_name"]) + "Config"
-        psm = _find_psm_node(graph, comp["psm_short"], comp.get("part_def_qname"))
-        attrs = _get_config_attributes(psm) if psm else []
         if attrs:
             injected_attrs = (
                 get_injected_config_attr_names(graph, psm, logger_type_qname)
@@ -14,6 +14,7 @@ from ..typescript.config import generated_ts_header
 from ..typescript.queries import (
     _find_psm_node,
     _get_config_attributes,
+    clear_component_map_cache,
     get_component_map,
     get_free_function_export_names,
     get_preamble_type_names,
@@ -32,6 +33,17 @@ class VitestGenerator(GeneratorTarget):
         self,
         graph: ModelGraph,
         options: GenerationOptions,
+    ) -> list[GeneratedArtifact]:
+        try:
+            return self._generate(graph, options)
+        finally:
+            # Component maps are memoized for one run; do not keep the graph alive after it.
+            clear_component_map_cache()
+
+    def _generate(
+        self,
+        graph: ModelGraph,
+        options: GenerationOptions,
     ) -> list[GeneratedArtifact]:
         output_dir = Path(options.output_dir)
         src_dir = output_dir / "src"
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ci.generators.errors import ParsingError, ValidationError
+from ci.generators.parsing import clear_parse_cache, parse_model_directory
+from ci.generators.parsing import driver
+from ci.generators.parsing.elements import (
+    _extract_elements,
+    _find_matching_brace,
+    _match_braces,
+    _newline_offsets,
+)
+from ci.generators.parsing.regex import ID_DECL_RE
+from ci.generators.validation import validate_model_index
+
+
+@pytest.fixture(autouse=True)
+def _fresh_parse_cache():
+    clear_parse_cache()
+    yield
+    clear_parse_cache()
+
+
+def _write_model(model_dir: Path, files: dict[str, str]) -> None:
+    for name, text in files.items():
+        path = model_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def _qualified_names(model_dir: Path, *, use_cache: bool = False) -> list[str]:
+    return [element.qualified_name for element in parse_model_directory(model_dir, use_cache=use_cache).elements]
+
+
+NESTED = """package Outer {
+    package Inner {
+        part def Deep { }
+    }
+    part def Sibling { }
+    package Machines {
+        state def Controller {
+            state Idle;
+        }
+    }
+    part def Last { }
+}
+package Second {
+    part def Top { }
+}
+"""
+
+
+def test_qualified_names_follow_enclosing_containers(tmp_path: Path) -> None:
+    _write_model(tmp_path, {"a.sysml": NESTED})
+
+    assert _qualified_names(tmp_path) == [
+        "Outer",
+        "Outer::Inner",
+        "Outer::Inner::Deep",
+        "Outer::Sibling",
+        "Outer::Machines",
+        "Outer::Machines::Controller",
+        "Outer::Machines::Controller::Idle",
+        "Outer::Last",
+        "Second",
+        "Second::Top",
+    ]
+
+
+IDS = """package Reqs {
+    requirement REQ_Bodiless;
+    state ST_Idle;
+    requirement def REQ_Block {
+        doc /* A requirement with a body. */
+    }
+    part 'Quoted_Name' { }
+    requirement <'R1'> REQ_Short { }
+    state def ST_Multi
+        {
+    }
+}
+"""
+
+
+def test_declared_ids_match_id_declaration_scan(tmp_path: Path) -> None:
+    _write_model(tmp_path, {"a.sysml": IDS})
+
+    index = parse_model_directory(tmp_path)
+
+    expected = [m.group("name") for m in ID_DECL_RE.finditer(IDS)]
+    assert expected == ["REQ_Bodiless", "ST_Idle", "REQ_Block", "ST_Multi"]
+    assert list(index.declared_ids) == expected
+    validate_model_index(index)
+
+
+def test_declared_ids_report_duplicates(tmp_path: Path) -> None:
+    _write_model(
+        tmp_path,
+        {
+            "a.sysml": IDS,
+            "b.sysml": "package Other {\n    requirement REQ_Bodiless;\n    state ST_Idle;\n    state ST_Idle;\n}\n",
+        },
+    )
+
+    index = parse_model_directory(tmp_path)
+
+    assert index.declared_ids["REQ_Bodiless"] == [tmp_path / "a.sysml", tmp_path / "b.sysml"]
+    assert index.declared_ids["ST_Idle"] == [tmp_path / "a.sysml", tmp_path / "b.sysml", tmp_path / "b.sysml"]
+    assert index.declared_ids["REQ_Block"] == [tmp_path / "a.sysml"]
+    with pytest.raises(ValidationError, match="REQ_Bodiless"):
+        validate_model_index(index)
+
+
+def _elements(text: str):
+    elements, _symbols = _extract_elements(Path("m.sysml"), text, _newline_offsets(text))
+    return elements
+
+
+def test_match_braces_skips_comments_and_strings() -> None:
+    text = """package P {
+    part def A { }
+    part def 'B{' {
+        doc /* { unbalanced in a comment */
+        attribute label = "}";
+    }
+}
+"""
+    pairs = _match_braces(text)
+
+    package_open = text.index("{")
+    one_line_open = text.index("{ }")
+    quoted_open = text.index("{", text.index("'B{'") + 4)
+    assert pairs[package_open] == text.rindex("}")
+    assert pairs[one_line_open] == one_line_open + 2
+    assert pairs[quoted_open] == text.index("}", text.index('"}"') + 3)
+    assert len(pairs) == 3
+    for open_index, close_index in pairs.items():
+        assert _find_matching_brace(text, open_index) == close_index
+
+
+def test_match_braces_counts_line_comment_braces() -> None:
+    # Only /* */ comments are skipped; braces after // still count, like in _find_matching_brace.
+    text = """part def A {
+    // see { B }
+}
+"""
+    pairs = _match_braces(text)
+
+    assert pairs[text.index("{ B")] == text.index("B }") + 2
+    assert pairs[text.index("{")] == text.rindex("}")
+    assert [e.name for e in _elements(text)] == ["A"]
+
+
+def test_extract_elements_one_line_block() -> None:
+    text = "part def A { attribute x : Real; }\n"
+
+    (element,) = _elements(text)
+
+    assert (element.start_line, element.end_line) == (1, 1)
+    assert [attr.name for attr in element.attributes] == ["x"]
+
+
+def test_extract_elements_falls_back_for_commented_declaration() -> None:
+    text = """part def X {
+    /*
+    part def Y { }
+    */
+}
+"""
+    nested_open = text.index("{ }")
+    assert nested_open not in _match_braces(text)
+
+    elements = {e.name: e for e in _elements(text)}
+
+    assert elements["Y"].end_index == nested_open + 2
+    assert elements["X"].end_index == text.rindex("}")
+
+
+def test_extract_elements_unbalanced_file() -> None:
+    text = """part def Closed {
+}
+part def Open {
+"""
+    assert list(_match_braces(text)) == [text.index("{")]
+
+    with pytest.raises(ParsingError, match="Unbalanced braces"):
+        _elements(text)
+
+
+ALPHA = """package Alpha {
+    part def Widget {
+        doc /* A widget. */
+    }
+}
+"""
+
+BETA = """package Beta {
+    part def Gadget {
+    }
+}
+"""
+
+
+@pytest.fixture
+def parse_calls(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every file the driver actually reads and parses."""
+    calls: list[Path] = []
+    parse_file = driver._parse_file
+
+    def recording_parse_file(file_path: Path):
+        calls.append(file_path)
+        return parse_file(file_path)
+
+    monkeypatch.setattr(driver, "_parse_file", recording_parse_file)
+    return calls
+
+
+def test_parse_cache_reuses_unchanged_files(tmp_path: Path, parse_calls: list[Path]) -> None:
+    _write_model(tmp_path, {"a.sysml": ALPHA, "sub/b.sysml": BETA})
+
+    first = parse_model_directory(tmp_path, use_cache=True)
+    assert len(parse_calls) == 2
+
+    second = parse_model_directory(tmp_path, use_cache=True)
+    assert len(parse_calls) == 2, "Unchanged files should come from the cache."
+    assert [e.qualified_name for e in second.elements] == [e.qualified_name for e in first.elements]
+
+
+def test_parse_cache_reparses_edited_file(tmp_path: Path, parse_calls: list[Path]) -> None:
+    _write_model(tmp_path, {"a.sysml": ALPHA, "sub/b.sysml": BETA})
+    parse_model_directory(tmp_path, use_cache=True)
+    parse_calls.clear()
+
+    edited = tmp_path / "sub" / "b.sysml"
+    stat = edited.stat()
+    edited.write_text(BETA.replace("Gadget", "Gizmo"), encoding="utf-8")
+    # Same size as before; only the mtime tells the cache the file changed.
+    os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert "Beta::Gizmo" in _qualified_names(tmp_path, use_cache=True)
+    assert parse_calls == [edited]
+
+
+def test_parse_cache_drops_deleted_file(tmp_path: Path) -> None:
+    _write_model(tmp_path, {"a.sysml": ALPHA, "sub/b.sysml": BETA})
+    parse_model_directory(tmp_path, use_cache=True)
+    deleted = tmp_path / "sub" / "b.sysml"
+    assert deleted in driver._FILE_CACHE
+
+    deleted.unlink()
+
+    assert "Beta::Gadget" not in _qualified_names(tmp_path, use_cache=True)
+    assert deleted not in driver._FILE_CACHE
+
+
+def test_parse_cache_is_opt_in(tmp_path: Path, parse_calls: list[Path]) -> None:
+    _write_model(tmp_path, {"a.sysml": ALPHA})
+
+    parse_model_directory(tmp_path)
+    parse_model_directory(tmp_path)
+
+    assert parse_calls == [tmp_path / "a.sysml"] * 2
+    assert not driver._FILE_CACHE
+
+
+def test_parse_cache_indexes_do_not_share_elements(tmp_path: Path) -> None:
+    _write_model(tmp_path, {"a.sysml": ALPHA})
+    first = parse_model_directory(tmp_path, use_cache=True)
+    first.by_qualified_name["Alpha::Widget"].qualified_name = "Changed::Widget"
+
+    second = parse_model_directory(tmp_path, use_cache=True)
+
+    assert "Alpha::Widget" in second.by_qualified_name
+    assert second.by_qualified_name["Alpha::Widget"].qualified_name == "Alpha::Widget"
+    assert not set(map(id, first.elements)) & set(map(id, second.elements))
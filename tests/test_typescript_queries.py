@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ci.generators.base import GenerationOptions
+from ci.generators.ir import ModelGraph
+from ci.generators.targets import typescript
+from ci.generators.targets.typescript import TypeScriptGenerator
+from ci.generators.targets.typescript import queries
+from ci.generators.targets.typescript.queries import clear_component_map_cache, get_component_map
+
+
+COMPONENT = {
+    "psm_short": "Parser",
+    "state_machine": "parserStates",
+    "output_file": "parser.ts",
+    "class_name": "Parser",
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_component_maps():
+    clear_component_map_cache()
+    yield
+    clear_component_map_cache()
+
+
+@pytest.fixture
+def build_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[ModelGraph, object | None]]:
+    """Record every component map that is actually built."""
+    calls: list[tuple[ModelGraph, object | None]] = []
+
+    def fake_build(graph: ModelGraph, document: object | None) -> list[dict[str, str]]:
+        calls.append((graph, document))
+        return [dict(COMPONENT)]
+
+    monkeypatch.setattr(queries, "_build_component_map", fake_build)
+    return calls
+
+
+def test_component_map_reused_for_same_graph_and_document(build_calls: list) -> None:
+    graph = ModelGraph()
+    document = object()
+
+    first = get_component_map(graph, document=document)
+    second = get_component_map(graph, document=document)
+
+    assert first == second == [COMPONENT]
+    assert build_calls == [(graph, document)]
+
+
+def test_component_map_results_are_independent(build_calls: list) -> None:
+    graph = ModelGraph()
+
+    first = get_component_map(graph)
+    first[0]["output_file"] = "changed.ts"
+    first.append({})
+
+    assert get_component_map(graph) == [COMPONENT]
+    assert len(build_calls) == 1
+
+
+def test_component_map_checks_identity_not_just_id(build_calls: list) -> None:
+    graph = ModelGraph()
+    stale_graph = ModelGraph()
+    # Simulate a recycled id(): the key matches but the stored graph is another object.
+    queries._COMPONENT_MAP_CACHE[(id(graph), id(None))] = (stale_graph, None, [{"output_file": "stale.ts"}])
+
+    assert get_component_map(graph) == [COMPONENT]
+    assert build_calls == [(graph, None)]
+
+
+def test_component_map_evicts_other_graphs(build_calls: list) -> None:
+    old_graph = ModelGraph()
+    new_graph = ModelGraph()
+    get_component_map(old_graph)
+
+    get_component_map(new_graph)
+
+    assert all(entry[0] is new_graph for entry in queries._COMPONENT_MAP_CACHE.values())
+    get_component_map(old_graph)
+    assert len(build_calls) == 3
+
+
+def test_clear_component_map_cache(build_calls: list) -> None:
+    graph = ModelGraph()
+    get_component_map(graph)
+
+    clear_component_map_cache()
+    get_component_map(graph)
+
+    assert len(build_calls) == 2
+
+
+def test_generate_releases_component_maps(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    options = GenerationOptions(version="v0", model_dir=tmp_path, output_dir=tmp_path / "out")
+    cached_during_run: list[int] = []
+
+    def recording_build_index(graph: ModelGraph, document: object | None = None) -> str:
+        cached_during_run.append(len(queries._COMPONENT_MAP_CACHE))
+        return ""
+
+    monkeypatch.setattr(typescript, "_build_index", recording_build_index)
+
+    TypeScriptGenerator().generate(ModelGraph(), options)
+
+    assert cached_during_run == [1]
+    assert not queries._COMPONENT_MAP_CACHE